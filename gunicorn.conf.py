@@ -0,0 +1,40 @@
+# Gunicorn settings for serving web.app in production
+#   uv run --extra server gunicorn -c gunicorn.conf.py web.app:app
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('FLASK_PORT', 5001)}"
+
+# Requests spend most of their time waiting on the weather API, so each
+# worker multiplexes many of them on gevent greenlets. The gevent worker
+# monkey-patches the standard library before the app is imported, and
+# post_fork below does the same for psycopg2.
+worker_class = "gevent"
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_connections = 1000
+timeout = 30
+
+
+def post_fork(server, worker):
+    """Make psycopg2 wait on PostgreSQL through gevent, as psycogreen does.
+
+    gevent's monkey-patching does not reach libpq's own sockets, so without a
+    wait callback every query blocks the whole worker.
+    """
+    import psycopg2
+    from gevent.socket import wait_read, wait_write
+    from psycopg2 import extensions
+
+    def gevent_wait_callback(conn, timeout=None):
+        while True:
+            state = conn.poll()
+            if state == extensions.POLL_OK:
+                break
+            elif state == extensions.POLL_READ:
+                wait_read(conn.fileno(), timeout=timeout)
+            elif state == extensions.POLL_WRITE:
+                wait_write(conn.fileno(), timeout=timeout)
+            else:
+                raise psycopg2.OperationalError(f"Bad result from poll: {state!r}")
+
+    extensions.set_wait_callback(gevent_wait_callback)
@@ -1,8 +1,26 @@
 import pytest
 
+from weather_app.api import WeatherAPI
+from weather_app.repository import LocationRepository
 from web.app import app as flask_app
 
 
+@pytest.fixture(autouse=True)
+def reset_favorites_cache():
+    """Keep cached favorite locations from leaking between tests."""
+    LocationRepository.invalidate_cache()
+    yield
+    LocationRepository.invalidate_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_weather_cache():
+    """Keep cached API responses from leaking between tests."""
+    WeatherAPI.clear_cache()
+    yield
+    WeatherAPI.clear_cache()
+
+
 @pytest.fixture
 def app():
     """Create and configure a new app instance for each test."""
@@ -10,13 +10,10 @@ from weather_app.api import WeatherAPI
 
 
 @pytest.fixture
-def mock_requests():
-    """Create a mock requests module for testing."""
-    with patch("weather_app.api.requests") as mock_req:
-        # Mock exceptions properly
-        mock_req.exceptions.RequestException = requests.exceptions.RequestException
-        mock_req.exceptions.Timeout = requests.exceptions.Timeout
-        yield mock_req
+def mock_session(api):
+    """Replace the API's HTTP session with a mock."""
+    with patch.object(api, "session") as session:
+        yield session
 
 
 @pytest.fixture
@@ -56,7 +53,15 @@ def test_init_no_api_key():
                 WeatherAPI()
 
 
-def test_get_weather_success(api, mock_requests):
+def test_session_reuses_connections(api):
+    """Test the API keeps a pooled session that retries gateway errors."""
+    adapter = api.session.get_adapter("https://api.weatherapi.com/v1/")
+    assert adapter._pool_maxsize == 50
+    assert adapter.max_retries.total == 2
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_get_weather_success(api, mock_session):
     """Test successful weather retrieval."""
     # Mock successful response
     mock_response = MagicMock()
@@ -66,7 +71,7 @@ def test_get_weather_success(api, mock_requests):
         "forecast": {"forecastday": [{"date": "2023-05-07"}]},
     }
     mock_response.raise_for_status.return_value = None
-    mock_requests.get.return_value = mock_response
+    mock_session.get.return_value = mock_response
 
     # Call the method
     result = api.get_weather("London")
@@ -77,21 +82,66 @@ def test_get_weather_success(api, mock_requests):
     assert result["current"]["temp_c"] == 15
 
     # Check that the API was called correctly
-    mock_requests.get.assert_called_once()
-    args, kwargs = mock_requests.get.call_args
+    mock_session.get.assert_called_once()
+    args, kwargs = mock_session.get.call_args
     assert "forecast.json" in args[0]
     assert kwargs["params"]["q"] == "London"
     assert kwargs["params"]["key"] == api.api_key
 
 
+def test_get_weather_is_cached_by_rounded_coordinates(api, mock_session):
+    """Test that nearby coordinates reuse a recent weather response."""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"location": {"name": "London"}}
+    mock_session.get.return_value = mock_response
+
+    first = api.get_weather("51.5074,-0.1278")
+    second = api.get_weather("51.5071,-0.1281")
+    assert first == second
+    mock_session.get.assert_called_once()
+
+    # A historical query for the same place is fetched separately
+    api.get_weather("51.5074,-0.1278", date="2023-05-01")
+    assert mock_session.get.call_count == 2
+
+    WeatherAPI.clear_cache()
+    api.get_weather("51.5074,-0.1278")
+    assert mock_session.get.call_count == 3
+
+
+def test_forecast_cache_outlives_weather_cache(api, mock_session):
+    """Test that forecasts are kept longer than current conditions."""
+    mock_session.get.return_value = MagicMock()
+
+    with patch("weather_app.api.time.monotonic", return_value=1000.0):
+        api.get_weather("London")
+        api.get_forecast("London", days=3)
+    assert mock_session.get.call_count == 2
+
+    # Past the current-weather TTL but well within the forecast TTL
+    with patch("weather_app.api.time.monotonic", return_value=1600.0):
+        api.get_weather("London")
+        api.get_forecast("London", days=3)
+    assert mock_session.get.call_count == 3
+
+
+def test_get_weather_sends_coordinate_pairs_as_text(api, mock_session):
+    """Test that a (lat, lon) pair is sent as a single "lat,lon" query."""
+    mock_session.get.return_value = MagicMock()
+
+    api.get_weather((51.5074, -0.1278))
+
+    _, kwargs = mock_session.get.call_args
+    assert kwargs["params"]["q"] == "51.5074,-0.1278"
+
+
 def test_get_weather_request_exception(api):
     """Test weather retrieval with request exception."""
-    with patch("weather_app.api.requests") as mock_requests:
+    with patch.object(api, "session") as mock_session:
         # Mock request exception with the real exception class
-        mock_requests.get.side_effect = requests.exceptions.RequestException(
+        mock_session.get.side_effect = requests.exceptions.RequestException(
             "Connection error"
         )
-        mock_requests.exceptions = requests.exceptions
 
         # Call the method
         result = api.get_weather("London")
@@ -100,15 +150,14 @@ def test_get_weather_request_exception(api):
         assert result is None
 
         # Check that the API was called
-        mock_requests.get.assert_called_once()
+        mock_session.get.assert_called_once()
 
 
 def test_get_weather_other_exception(api):
     """Test weather retrieval with other exception."""
-    with patch("weather_app.api.requests") as mock_requests:
+    with patch.object(api, "session") as mock_session:
         # Mock other exception
-        mock_requests.get.side_effect = Exception("Unexpected error")
-        mock_requests.exceptions = requests.exceptions
+        mock_session.get.side_effect = Exception("Unexpected error")
 
         # Call the method
         result = api.get_weather("London")
@@ -117,10 +166,10 @@ def test_get_weather_other_exception(api):
         assert result is None
 
         # Check that the API was called
-        mock_requests.get.assert_called_once()
+        mock_session.get.assert_called_once()
 
 
-def test_search_city_success(api, mock_requests):
+def test_search_city_success(api, mock_session):
     """Test successful city search."""
     # Mock successful response
     mock_response = MagicMock()
@@ -128,7 +177,7 @@ def test_search_city_success(api, mock_requests):
         {"name": "London", "country": "UK", "lat": 51.52, "lon": -0.11}
     ]
     mock_response.raise_for_status.return_value = None
-    mock_requests.get.return_value = mock_response
+    mock_session.get.return_value = mock_response
 
     # Call the method
     result = api.search_city("London")
@@ -139,20 +188,33 @@ def test_search_city_success(api, mock_requests):
     assert result[0]["name"] == "London"
 
     # Check that the API was called correctly
-    mock_requests.get.assert_called_once()
-    args, kwargs = mock_requests.get.call_args
+    mock_session.get.assert_called_once()
+    args, kwargs = mock_session.get.call_args
     assert "search.json" in args[0]
     assert kwargs["params"]["q"] == "London"
     assert kwargs["params"]["key"] == api.api_key
 
 
-def test_search_city_no_results(api, mock_requests):
+def test_search_city_is_cached(api, mock_session):
+    """Test that repeating a search reuses the earlier results."""
+    mock_response = MagicMock()
+    mock_response.json.return_value = [{"name": "London", "lat": 51.52, "lon": -0.11}]
+    mock_session.get.return_value = mock_response
+
+    first = api.search_city("London")
+    second = api.search_city(" london ")
+
+    assert first == second
+    mock_session.get.assert_called_once()
+
+
+def test_search_city_no_results(api, mock_session):
     """Test city search with no results."""
     # Mock empty response
     mock_response = MagicMock()
     mock_response.json.return_value = []
     mock_response.raise_for_status.return_value = None
-    mock_requests.get.return_value = mock_response
+    mock_session.get.return_value = mock_response
 
     # Call the method
     result = api.search_city("NonexistentCity")
@@ -161,17 +223,16 @@ def test_search_city_no_results(api, mock_requests):
     assert result == []
 
     # Check that the API was called
-    mock_requests.get.assert_called_once()
+    mock_session.get.assert_called_once()
 
 
 def test_search_city_request_exception(api):
     """Test city search with request exception."""
-    with patch("weather_app.api.requests") as mock_requests:
+    with patch.object(api, "session") as mock_session:
         # Mock request exception with the real exception class
-        mock_requests.get.side_effect = requests.exceptions.RequestException(
+        mock_session.get.side_effect = requests.exceptions.RequestException(
             "Connection error"
         )
-        mock_requests.exceptions = requests.exceptions
 
         # Call the method
         result = api.search_city("London")
@@ -180,15 +241,14 @@ def test_search_city_request_exception(api):
         assert result is None
 
         # Check that the API was called
-        mock_requests.get.assert_called_once()
+        mock_session.get.assert_called_once()
 
 
 def test_search_city_other_exception(api):
     """Test city search with other exception."""
-    with patch("weather_app.api.requests") as mock_requests:
+    with patch.object(api, "session") as mock_session:
         # Mock other exception
-        mock_requests.get.side_effect = Exception("Unexpected error")
-        mock_requests.exceptions = requests.exceptions
+        mock_session.get.side_effect = Exception("Unexpected error")
 
         # Call the method
         result = api.search_city("London")
@@ -197,4 +257,4 @@ def test_search_city_other_exception(api):
         assert result is None
 
         # Check that the API was called
-        mock_requests.get.assert_called_once()
+        mock_session.get.assert_called_once()
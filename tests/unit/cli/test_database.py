@@ -128,7 +128,7 @@ def test_get_session(mock_session_class: MagicMock) -> None:
             session.query(Location)
 
         # Check that session was created with the engine
-        mock_session_class.assert_called_with(mock_engine)
+        mock_session_class.assert_called_with(mock_engine, expire_on_commit=False)
 
 
 @patch("weather_app.database.Session")
@@ -158,7 +158,7 @@ def test_get_session_exception(mock_session_class: MagicMock) -> None:
             pass
 
         # The session context manager should handle cleanup automatically
-        mock_session_class.assert_called_with(mock_engine)
+        mock_session_class.assert_called_with(mock_engine, expire_on_commit=False)
 
 
 @patch("weather_app.database.Database")
@@ -205,4 +205,4 @@ def test_get_session_fastapi(
         pass
 
     # Check that session was created with the engine
-    mock_session_class.assert_called_with(mock_engine)
+    mock_session_class.assert_called_with(mock_engine, expire_on_commit=False)
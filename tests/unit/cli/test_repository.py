@@ -1,10 +1,19 @@
+import logging
 import os
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import event, text, update
 
 from weather_app.database import Database
-from weather_app.models import Location, UserSettings, WeatherRecord
+from weather_app.models import (
+    Location,
+    UserSettings,
+    WeatherRecord,
+    neighboring_buckets,
+)
 from weather_app.repository import (
     LocationRepository,
     SettingsRepository,
@@ -12,6 +21,22 @@ from weather_app.repository import (
 )
 
 
+@contextmanager
+def recorded_statements(session):
+    """Collect the SQL statements run on the session's engine inside the block"""
+    statements = []
+
+    def record_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+
 @pytest.fixture(scope="function")
 def test_db():
     """Create a test database connection"""
@@ -136,6 +161,62 @@ def test_location_search(location_repo):
     assert {loc.name for loc in results} == {"New York", "Los Angeles"}
 
 
+def test_location_search_matches_word_prefixes(location_repo):
+    """Test that search matches every query word as a prefix"""
+    with location_repo.db.get_session() as session:
+        session.query(WeatherRecord).delete()
+        session.query(Location).delete()
+        session.commit()
+
+    location_repo.create(
+        Location(
+            name="New York",
+            latitude=40.7128,
+            longitude=-74.0060,
+            country="USA",
+            region="New York State",
+        )
+    )
+    location_repo.create(
+        Location(name="Newcastle", latitude=54.97, longitude=-1.61, country="UK")
+    )
+
+    assert {loc.name for loc in location_repo.search("new")} == {
+        "New York",
+        "Newcastle",
+    }
+    assert [loc.name for loc in location_repo.search("new york")] == ["New York"]
+    assert location_repo.search("?!") == []
+
+    # Words match from their start only; the old ILIKE search found substrings
+    assert [loc.name for loc in location_repo.search("york")] == ["New York"]
+    assert location_repo.search("ork") == []
+
+
+def test_location_search_without_index_warns_once(location_repo, caplog, monkeypatch):
+    """Test that an unmigrated database falls back to LIKE with one warning"""
+    # Restored afterwards, so later tests use the full-text index again
+    monkeypatch.setattr(LocationRepository, "_full_text_search", True)
+    with location_repo.db.get_session() as session:
+        session.query(WeatherRecord).delete()
+        session.query(Location).delete()
+        for trigger in ("location_fts_ai", "location_fts_ad", "location_fts_au"):
+            session.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        session.execute(text("DROP TABLE IF EXISTS location_fts"))
+        session.commit()
+
+    location_repo.create(
+        Location(name="New York", latitude=40.7128, longitude=-74.0060, country="USA")
+    )
+
+    with caplog.at_level(logging.WARNING, logger="weather_app.repository"):
+        assert [loc.name for loc in location_repo.search("ork")] == ["New York"]
+        assert [loc.name for loc in location_repo.search("new")] == ["New York"]
+
+    warnings = [r for r in caplog.records if "Full-text search" in r.getMessage()]
+    assert len(warnings) == 1
+
+
 def test_location_favorites(location_repo):
     """Test getting favorite locations"""
     # Clear any existing data first (delete weather records first
@@ -322,6 +403,80 @@ def test_location_repo_find_by_coordinates(mock_location_repo, test_db_session):
     assert result.name == location.name
 
 
+def test_location_repo_find_by_nearby_coordinates(mock_location_repo, test_db_session):
+    """Test finding a location by coordinates within the threshold."""
+    location = Location(
+        name="Test City",
+        latitude=40.7128,
+        longitude=-74.0060,
+        country="Test Country",
+    )
+    test_db_session.add(location)
+    test_db_session.commit()
+    test_db_session.refresh(location)
+
+    # The coordinate bucket is populated on insert
+    assert location.geohash_bucket is not None
+
+    # Slightly offset coordinates (possibly in a neighboring bucket) match
+    result = mock_location_repo.find_by_coordinates(40.7199, -74.0001)
+    assert result is not None
+    assert result.id == location.id
+
+    # Coordinates outside the threshold do not
+    assert mock_location_repo.find_by_coordinates(40.7400, -74.0060) is None
+
+
+def test_location_repo_find_or_create_by_coordinates(mock_location_repo):
+    """Test that find_or_create only inserts a location once."""
+    created = mock_location_repo.find_or_create_by_coordinates(
+        "Test City", 40.7128, -74.0060, "Test Country"
+    )
+    assert created.id is not None
+    assert created.name == "Test City"
+
+    found = mock_location_repo.find_or_create_by_coordinates(
+        "Other Name", 40.7130, -74.0062, "Test Country"
+    )
+    assert found.id == created.id
+    assert found.name == "Test City"
+    assert mock_location_repo.count() == 1
+
+
+def test_location_repo_find_or_create_locks_buckets_on_postgres():
+    """Test that PostgreSQL creation is serialized on the coordinate buckets."""
+    repo = LocationRepository()
+    repo.db = MagicMock()
+    session = repo.db.get_session.return_value.__enter__.return_value
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute.return_value.scalar_one_or_none.return_value = 7
+
+    with patch.object(repo, "find_by_coordinates", return_value=None):
+        created = repo.find_or_create_by_coordinates("Test City", 40.7128, -74.0060)
+
+    assert created.id == 7
+    lock_statement, lock_params = session.execute.call_args_list[0].args
+    assert "pg_advisory_xact_lock" in str(lock_statement)
+    assert lock_params["buckets"] == sorted(neighboring_buckets(40.7128, -74.0060))
+    # The guarded insert runs after the lock, in the same transaction
+    assert session.execute.call_count == 2
+    session.commit.assert_called_once()
+
+
+def test_location_repo_bulk_create_sets_bucket(mock_location_repo):
+    """Test that bulk-created locations can be found by coordinates."""
+    locations = [
+        Location(name="City A", latitude=40.7128, longitude=-74.0060, country="X"),
+        Location(name="City B", latitude=51.5074, longitude=-0.1278, country="Y"),
+    ]
+
+    assert mock_location_repo.bulk_create(locations) == 2
+
+    result = mock_location_repo.find_by_coordinates(51.5074, -0.1278)
+    assert result is not None
+    assert result.name == "City B"
+
+
 def test_location_repo_get_favorites(mock_location_repo, test_db_session):
     """Test getting favorite locations."""
     # Create favorite and non-favorite locations
@@ -354,6 +509,111 @@ def test_location_repo_get_favorites(mock_location_repo, test_db_session):
     assert favorites[0].is_favorite is True
 
 
+def test_location_repo_get_favorites_single_query(mock_location_repo, test_db_session):
+    """Test that favorites load in one query however many there are."""
+    for i in range(5):
+        test_db_session.add(
+            Location(
+                name=f"City {i}",
+                latitude=10.0 * i,
+                longitude=10.0 * i,
+                country="Test Country",
+                region="Test Region",
+                is_favorite=True,
+            )
+        )
+    test_db_session.commit()
+
+    with recorded_statements(test_db_session) as statements:
+        favorites = mock_location_repo.get_favorites()
+        # The index page reads these columns for every favorite
+        for location in favorites:
+            assert location.name and location.region and location.country
+
+    assert len(favorites) == 5
+    assert len(statements) == 1
+
+
+def test_location_repo_get_favorites_cached(mock_location_repo, test_db_session):
+    """Test that favorites are reused until a location is written."""
+    location = Location(
+        name="Favorite City",
+        latitude=10.0,
+        longitude=20.0,
+        country="Test Country",
+        is_favorite=True,
+    )
+    test_db_session.add(location)
+    test_db_session.commit()
+    location_id = location.id
+
+    with recorded_statements(test_db_session) as statements:
+        assert len(mock_location_repo.get_favorites()) == 1
+        assert len(mock_location_repo.get_favorites()) == 1
+    # The cached read only runs the version check, not the row query
+    assert len(statements) == 2
+    assert "count" in statements[1].lower()
+
+    # Unfavoriting through the repository clears the cached list
+    mock_location_repo.update(location_id, {"is_favorite": False})
+    assert mock_location_repo.get_favorites() == []
+
+
+def test_location_repo_get_favorites_with_known_version(
+    mock_location_repo, test_db_session
+):
+    """Test that a version the caller already read is not queried again."""
+    location = Location(
+        name="Favorite City",
+        latitude=10.0,
+        longitude=20.0,
+        country="Test Country",
+        is_favorite=True,
+    )
+    test_db_session.add(location)
+    test_db_session.commit()
+    version = mock_location_repo.get_favorites_version()
+    assert len(mock_location_repo.get_favorites(version)) == 1
+
+    with recorded_statements(test_db_session) as statements:
+        assert len(mock_location_repo.get_favorites(version)) == 1
+        assert statements == []
+
+        # A different version means the cached list is out of date
+        assert len(mock_location_repo.get_favorites((2, None))) == 1
+        assert len(statements) == 1
+
+
+def test_location_repo_favorites_follow_other_processes(
+    mock_location_repo, test_db_session
+):
+    """Test that favorites changed without this cache's knowledge are reloaded."""
+    location = Location(
+        name="Favorite City",
+        latitude=10.0,
+        longitude=20.0,
+        country="Test Country",
+        is_favorite=True,
+        updated_at=datetime(2025, 1, 1),
+    )
+    test_db_session.add(location)
+    test_db_session.commit()
+    assert [fav.name for fav in mock_location_repo.get_favorites()] == ["Favorite City"]
+
+    # Another worker renames the favorite directly in the database
+    location.name = "Renamed City"
+    location.updated_at = datetime(2025, 1, 2)
+    test_db_session.add(location)
+    test_db_session.commit()
+    assert [fav.name for fav in mock_location_repo.get_favorites()] == ["Renamed City"]
+
+    # ...and then removes it from the favorites
+    location.is_favorite = False
+    test_db_session.add(location)
+    test_db_session.commit()
+    assert mock_location_repo.get_favorites() == []
+
+
 def test_location_repo_update(mock_location_repo, test_db_session):
     """Test updating a location."""
     # Create a location first
@@ -438,6 +698,83 @@ def test_settings_repo_update_temperature_unit(
     assert db_settings.temperature_unit == "fahrenheit"
 
 
+def test_settings_repo_get_settings_sees_other_writers(
+    mock_settings_repo, test_db_session, sample_user_settings
+):
+    """Test that settings written by another process are read back at once."""
+    test_db_session.add(sample_user_settings)
+    test_db_session.commit()
+    assert mock_settings_repo.get_settings().temperature_unit == "celsius"
+
+    # Another worker changes the unit directly in the database
+    test_db_session.execute(
+        update(UserSettings)
+        .where(UserSettings.id == 1)
+        .values(temperature_unit="fahrenheit")
+    )
+    test_db_session.commit()
+    assert mock_settings_repo.get_settings().temperature_unit == "fahrenheit"
+
+
+def test_weather_repo_bulk_create(mock_weather_repo, test_db_session):
+    """Test inserting several weather records in one batch."""
+    location = Location(
+        name="Test City",
+        latitude=40.7128,
+        longitude=-74.0060,
+        country="Test Country",
+    )
+    test_db_session.add(location)
+    test_db_session.commit()
+    test_db_session.refresh(location)
+
+    records = [
+        WeatherRecord(
+            location_id=location.id,
+            timestamp=datetime(2023, 5, day, 12, 0, 0),
+            temperature=15.0 + day,
+            condition="Sunny",
+        )
+        for day in range(1, 4)
+    ]
+
+    assert mock_weather_repo.bulk_create(records) == 3
+    assert mock_weather_repo.bulk_create([]) == 0
+
+    results = mock_weather_repo.get_by_location(location.id)
+    assert [r.temperature for r in results] == [18.0, 17.0, 16.0]
+
+
+def test_weather_repo_bulk_create_mixed_ids(mock_weather_repo, test_db_session):
+    """Test a batch where only some records already have an ID."""
+    location = Location(
+        name="Test City",
+        latitude=40.7128,
+        longitude=-74.0060,
+        country="Test Country",
+    )
+    test_db_session.add(location)
+    test_db_session.commit()
+    test_db_session.refresh(location)
+
+    records = [
+        WeatherRecord(
+            id=100 if day == 1 else None,
+            location_id=location.id,
+            timestamp=datetime(2023, 5, day, 12, 0, 0),
+            temperature=15.0 + day,
+            condition="Sunny",
+        )
+        for day in range(1, 4)
+    ]
+
+    assert mock_weather_repo.bulk_create(records) == 3
+
+    results = mock_weather_repo.get_by_location(location.id)
+    assert [r.temperature for r in results] == [18.0, 17.0, 16.0]
+    assert mock_weather_repo.get_by_id(100).temperature == 16.0
+
+
 def test_weather_repo_get_by_location(mock_weather_repo, test_db_session):
     """Test getting weather records for a location."""
     # Create a location first
@@ -514,3 +851,37 @@ def test_weather_repo_get_latest_for_location(mock_weather_repo, test_db_session
     # Check that the weather record was returned
     assert record is not None
     assert record.temperature == weather_record.temperature
+
+
+def test_weather_repo_get_latest_for_locations(mock_weather_repo, test_db_session):
+    """Test getting the latest weather record for several locations at once."""
+    locations = [
+        Location(name="First", latitude=10.0, longitude=10.0, country="A"),
+        Location(name="Second", latitude=20.0, longitude=20.0, country="B"),
+        Location(name="Empty", latitude=30.0, longitude=30.0, country="C"),
+    ]
+    for location in locations:
+        test_db_session.add(location)
+    test_db_session.commit()
+    for location in locations:
+        test_db_session.refresh(location)
+
+    first, second, empty = locations
+    for location, temperatures in ((first, [10.0, 11.0]), (second, [20.0, 21.0])):
+        for hour, temperature in enumerate(temperatures):
+            test_db_session.add(
+                WeatherRecord(
+                    location_id=location.id,
+                    timestamp=datetime(2023, 5, 7, hour, 0, 0),
+                    temperature=temperature,
+                    condition="Sunny",
+                )
+            )
+    test_db_session.commit()
+
+    latest = mock_weather_repo.get_latest_for_locations([first.id, second.id, empty.id])
+
+    assert set(latest) == {first.id, second.id}
+    assert latest[first.id].temperature == 11.0
+    assert latest[second.id].temperature == 21.0
+    assert mock_weather_repo.get_latest_for_locations([]) == {}
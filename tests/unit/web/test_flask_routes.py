@@ -1,6 +1,7 @@
 """Unit tests for Flask routes and app functionality."""
 
 import json
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -56,6 +57,44 @@ class TestIndexRoute:
         assert b'name="location"' in response.data
         assert b'name="forecast_days"' in response.data
 
+    def test_index_page_conditional_get(self, client):
+        """Test that an unchanged index page is answered with 304."""
+        response = client.get("/")
+        assert response.status_code == 200
+        assert "no-cache" in response.headers["Cache-Control"]
+        etag = response.headers["ETag"]
+
+        # The embedded CSRF token is re-signed every second; the tag ignores it
+        with patch("web.helpers.time.time", return_value=time.time() + 5):
+            response = client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+    def test_index_page_etag_follows_favorites(self, client):
+        """Test that a change to the favorites invalidates the index page."""
+        with patch("web.app.location_repo") as mock_repo:
+            mock_repo.get_favorites.return_value = []
+            mock_repo.get_favorites_version.return_value = (0, None)
+            etag = client.get("/").headers["ETag"]
+
+            mock_repo.get_favorites_version.return_value = (1, None)
+            response = client.get("/", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert response.headers["ETag"] != etag
+            # The version read for the ETag is reused for the favorites cache
+            mock_repo.get_favorites.assert_called_with((1, None))
+            assert mock_repo.get_favorites_version.call_count == 2
+
+    def test_index_page_compressed(self, client):
+        """Test that pages are compressed for clients that accept it."""
+        pytest.importorskip("flask_compress")
+        import gzip
+
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert b"Weather Dashboard" in gzip.decompress(response.data)
+
 
 class TestSearchRoute:
     """Test the search route."""
@@ -122,6 +161,37 @@ class TestWeatherRoute:
             assert response.status_code == 200
             assert b"London" in response.data
 
+    def test_weather_conditional_get_skips_fetch(self, client):
+        """Test that a revalidated weather page is answered before fetching."""
+        with (
+            patch("web.app.get_weather_data") as mock_get_weather,
+            patch("web.helpers.Helpers.save_weather_record") as mock_save,
+        ):
+            mock_location = MagicMock()
+            mock_location.name = "London"
+            mock_location.id = None
+            mock_get_weather.return_value = (
+                {"current": {"temp_c": 15.0, "temp_f": 59.0}},
+                mock_location,
+            )
+
+            response = client.get("/weather/51.5074/-0.1278")
+            assert response.status_code == 200
+            etag = response.headers["ETag"]
+
+            response = client.get(
+                "/weather/51.5074/-0.1278", headers={"If-None-Match": etag}
+            )
+            assert response.status_code == 304
+            mock_get_weather.assert_called_once()
+            mock_save.assert_called_once()
+
+            # Another unit is a different page
+            response = client.get(
+                "/weather/51.5074/-0.1278?unit=F", headers={"If-None-Match": etag}
+            )
+            assert response.status_code == 200
+
     def test_weather_invalid_coordinates(self, client):
         """Test weather route with invalid coordinates."""
         # Test latitude out of range
@@ -147,7 +217,7 @@ class TestForecastRoute:
 
     def test_forecast_get_request(self, client):
         """Test GET request to forecast route."""
-        with patch("web.app.get_forecast_data") as mock_get_forecast:
+        with patch("web.app.get_forecast_with_location") as mock_get_forecast:
             mock_forecast_data = [
                 {
                     "date": "2023-05-07",
@@ -159,7 +229,7 @@ class TestForecastRoute:
                     },
                 }
             ]
-            mock_get_forecast.return_value = mock_forecast_data
+            mock_get_forecast.return_value = (mock_forecast_data, MagicMock())
 
             response = client.get("/forecast/51.5074/-0.1278")
             # Note: The actual route might redirect or behave differently
@@ -167,13 +237,61 @@ class TestForecastRoute:
 
     def test_forecast_with_days_parameter(self, client):
         """Test forecast route with days parameter."""
-        with patch("web.app.get_forecast_data") as mock_get_forecast:
+        with patch("web.app.get_forecast_with_location") as mock_get_forecast:
             mock_forecast_data = []  # Empty forecast for testing
             mock_get_forecast.return_value = mock_forecast_data
 
             response = client.get("/forecast/51.5074/-0.1278?days=5")
             assert response.status_code in [200, 302]
 
+    def test_forecast_location_comes_from_forecast_response(
+        self, client, mock_weather_api
+    ):
+        """Test that the forecast response alone names a new location."""
+        from weather_app.models import Location
+
+        location = Location(
+            id=1,
+            name="Custom Location",
+            latitude=51.5074,
+            longitude=-0.1278,
+            country="Unknown",
+        )
+        renamed = Location(
+            id=1, name="London", latitude=51.5074, longitude=-0.1278, country="UK"
+        )
+        mock_weather_api.get_forecast.return_value = {
+            "location": {"name": "London", "country": "UK", "region": "City"},
+            "forecast": {"forecastday": []},
+        }
+        with patch("web.helpers.Helpers.location_repo") as mock_repo:
+            mock_repo.find_or_create_by_coordinates.return_value = location
+            mock_repo.update.return_value = renamed
+
+            response = client.get("/forecast/51.5074/-0.1278")
+
+        assert response.status_code == 200
+        assert b"London" in response.data
+        mock_weather_api.get_forecast.assert_called_once()
+        mock_weather_api.get_weather.assert_not_called()
+        mock_repo.find_or_create_by_coordinates.assert_called_once_with(
+            name="London",
+            latitude=51.5074,
+            longitude=-0.1278,
+            country="UK",
+            region="City",
+        )
+        mock_repo.update.assert_called_once_with(
+            1, {"name": "London", "country": "UK", "region": "City"}
+        )
+
+    def test_forecast_invalid_coordinates(self, client):
+        """Test forecast route rejects out-of-range coordinates up front."""
+        with patch("web.app.get_forecast_with_location") as mock_get_forecast:
+            response = client.get("/forecast/91.0/-0.1278")
+            assert response.status_code == 302
+            mock_get_forecast.assert_not_called()
+
 
 class TestApiWeatherRoute:
     """Test the API weather route."""
@@ -190,6 +308,39 @@ class TestApiWeatherRoute:
             assert response.status_code == 200
             data = json.loads(response.data)
             assert "current" in data
+            assert "public" in response.headers["Cache-Control"]
+
+            # Revalidating with the ETag skips the body
+            repeat = client.get(
+                "/api/weather/51.5074/0.1278",
+                headers={"If-None-Match": response.headers["ETag"]},
+            )
+            assert repeat.status_code == 304
+            assert repeat.data == b""
+
+
+class TestJsonProvider:
+    """Test the orjson-backed JSON provider."""
+
+    def test_orjson_provider_matches_default_output(self, flask_app):
+        """Test orjson output keeps Flask's key order and date format."""
+        pytest.importorskip("orjson")
+        from datetime import datetime
+
+        from flask.json.provider import DefaultJSONProvider
+
+        from web.json_provider import OrjsonProvider
+
+        data = {"temp_c": 15.0, "city": "Zürich", "at": datetime(2025, 5, 23, 12)}
+        provider = OrjsonProvider(flask_app)
+        default = DefaultJSONProvider(flask_app)
+        default.ensure_ascii = False
+        provider.sort_keys = default.sort_keys = False
+
+        assert provider.loads(provider.dumps(data)) == default.loads(
+            default.dumps(data)
+        )
+        assert provider.dumps(data).index("temp_c") < provider.dumps(data).index("at")
 
 
 class TestUnitRoute:
@@ -252,6 +403,21 @@ class TestUILocationRoute:
         response = client.post("/ui", data={"location": ""})
         assert response.status_code in [200, 302]
 
+    def test_ui_location_normalizes_unit(self, client, mock_weather_api):
+        """Test that an unknown unit falls back to the default."""
+        mock_weather_api.search_city.return_value = [
+            {"name": "Paris", "country": "France", "lat": 48.85, "lon": 2.35}
+        ]
+        response = client.post("/ui", data={"location": "Paris", "unit": "k"})
+        assert response.status_code == 302
+        assert "unit=C" in response.headers["Location"]
+
+    def test_ui_location_blank_skips_search(self, client, mock_weather_api):
+        """Test that whitespace-only input never reaches the city search."""
+        response = client.post("/ui", data={"location": "   "})
+        assert response.status_code == 302
+        mock_weather_api.search_city.assert_not_called()
+
 
 class TestForecastFormRoute:
     """Test the forecast form route."""
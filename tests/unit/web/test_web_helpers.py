@@ -1,6 +1,7 @@
 """Unit tests for web helpers and utilities - fixed version."""
 
 from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
 
 import pytest
 from freezegun import freeze_time
@@ -83,6 +84,57 @@ class TestHelpers:
         unit = web_helpers.Helpers.get_normalized_unit("f")
         assert unit == "F"
 
+    def test_get_weather_data_names_location_from_response(self, web_modules_combined):
+        """Test that new coordinates are named without a second weather request."""
+        web_helpers, _ = web_modules_combined
+        Helpers = web_helpers.Helpers
+        weather_api = MagicMock()
+        weather_api.get_weather.return_value = {
+            "location": {"name": "London", "country": "UK", "region": "City"},
+            "current": dict.fromkeys(web_helpers.CURRENT_WEATHER_FIELDS, 0),
+        }
+        stored = MagicMock()
+        stored.name = "London"
+
+        with patch.object(Helpers, "location_repo") as mock_repo:
+            with patch.object(Helpers, "_reverse_geocode") as mock_geocode:
+                mock_repo.find_or_create_by_coordinates.return_value = stored
+                _, location = web_helpers.get_weather_data(
+                    (51.5074, -0.1278), "C", weather_api
+                )
+
+        assert location is stored
+        weather_api.get_weather.assert_called_once_with((51.5074, -0.1278))
+        mock_geocode.assert_not_called()
+        mock_repo.find_or_create_by_coordinates.assert_called_once_with(
+            name="London",
+            latitude=51.5074,
+            longitude=-0.1278,
+            country="UK",
+            region="City",
+        )
+
+    def test_save_weather_records_writes_queued_records_together(
+        self, web_modules_combined
+    ):
+        """Test that records queued before a save task runs share one insert."""
+        web_helpers, _ = web_modules_combined
+        Helpers = web_helpers.Helpers
+        weather_data = {"current": {"temp_c": 20.0, "condition": {"text": "Sunny"}}}
+
+        with patch.object(web_helpers, "_background_executor") as mock_executor:
+            with patch.object(Helpers, "current_manager") as mock_manager:
+                Helpers.save_weather_record(MagicMock(id=1), weather_data)
+                Helpers.save_weather_record(MagicMock(id=2), weather_data)
+                assert mock_executor.submit.call_count == 2
+
+                Helpers._save_weather_records()
+                Helpers._save_weather_records()
+
+        mock_manager.weather_repo.bulk_create.assert_called_once()
+        (records,) = mock_manager.weather_repo.bulk_create.call_args.args
+        assert len(records) == 2
+
     def test_normalize_location_input_known_abbreviation(self, web_modules_combined):
         """Test normalizing location input with known abbreviations."""
         web_helpers, _ = web_modules_combined
@@ -361,6 +413,22 @@ class TestNaturalLanguageProcessing:
         assert filtered["forecast"]["forecastday"][0]["date"] == "2025-05-24"
         assert filtered["forecast"]["forecastday"][1]["date"] == "2025-05-25"
 
+    def test_filter_formatted_forecast_by_dates(self, web_modules_combined):
+        """Test filtering an already formatted forecast list by dates."""
+        web_helpers, _ = web_modules_combined
+
+        forecast_data = [
+            {"date": "2025-05-23"},
+            {"date": "2025-05-24"},
+            {"date": "2025-05-25"},
+        ]
+
+        filtered = web_helpers.filter_forecast_by_dates(
+            forecast_data, datetime(2025, 5, 23), datetime(2025, 5, 24)
+        )
+
+        assert [day["date"] for day in filtered] == ["2025-05-23", "2025-05-24"]
+
     @freeze_time("2025-05-23")
     def test_complex_nl_queries(self, web_modules_combined):
         """Test handling of complex natural language queries."""
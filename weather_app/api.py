@@ -1,5 +1,9 @@
 import logging
+import threading
+import time
+from functools import lru_cache
 from typing import (
+    Any,
     Optional,
     TypedDict,
     Union,
@@ -8,6 +12,8 @@ from typing import (
 
 import requests
 from decouple import config
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .weather_types import WeatherResponse
 
@@ -20,6 +26,24 @@ CONNECTION_TIMEOUT: int = 5  # Maximum time to wait for connection establishment
 READ_TIMEOUT: int = 15  # Maximum time to wait for server response
 REQUEST_TIMEOUT: tuple[int, int] = (CONNECTION_TIMEOUT, READ_TIMEOUT)
 
+# Keep-alive connection pool and retry policy for the weather service
+POOL_CONNECTIONS: int = 20
+POOL_MAXSIZE: int = 50
+REQUEST_RETRIES: int = 2
+RETRY_BACKOFF_FACTOR: float = 0.1
+RETRY_STATUS_CODES: tuple[int, ...] = (502, 503, 504)
+
+# Weather responses are reused for this many seconds (0 disables caching)
+WEATHER_CACHE_TTL: float = config("WEATHER_CACHE_TTL", default=300.0, cast=float)
+# Forecasts change less often than current conditions
+FORECAST_CACHE_TTL: float = config("FORECAST_CACHE_TTL", default=1800.0, cast=float)
+# City search results rarely change
+SEARCH_CACHE_TTL: float = config("SEARCH_CACHE_TTL", default=3600.0, cast=float)
+WEATHER_CACHE_SIZE: int = 256
+
+# Coordinates closer than this many decimal places share a cached response
+CACHE_COORDINATE_PRECISION: int = 2
+
 # Define typed dictionaries for API responses
 
 
@@ -33,7 +57,86 @@ class CitySearchResult(TypedDict, total=False):
     url: str
 
 
+@lru_cache(maxsize=4096)
+def _normalize_location(location: Any) -> tuple[str, Any]:
+    """Return the API query and the cache key for a location
+
+    Coordinates may arrive as "lat,lon" text or as a (lat, lon) pair; pairs
+    are sent as the "lat,lon" text the API expects. Coordinates are rounded in
+    the cache key so nearby lookups share an entry.
+    """
+    if isinstance(location, str):
+        query = location
+        try:
+            coords = [float(part) for part in location.split(",")]
+        except ValueError:
+            return query, location.strip().lower()
+    else:
+        query = ",".join(str(coord) for coord in location)
+        coords = [float(coord) for coord in location]
+    if len(coords) != 2:
+        return query, query
+    return query, tuple(round(coord, CACHE_COORDINATE_PRECISION) for coord in coords)
+
+
+def _build_session() -> requests.Session:
+    """Create a session that reuses connections and retries gateway errors"""
+    retry = Retry(
+        total=REQUEST_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class WeatherAPI:
+    # Recent responses shared by all instances: key -> (fetched_at, response)
+    _response_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+    _cache_lock = threading.Lock()
+
+    @classmethod
+    def _get_cached(
+        cls, key: tuple[Any, ...], ttl: float = WEATHER_CACHE_TTL
+    ) -> Optional[Any]:
+        with cls._cache_lock:
+            entry = cls._response_cache.get(key)
+            if entry is None:
+                return None
+            fetched_at, response = entry
+            if time.monotonic() - fetched_at >= ttl:
+                cls._response_cache.pop(key, None)
+                return None
+            return response
+
+    @classmethod
+    def _store_cached(
+        cls,
+        key: tuple[Any, ...],
+        response: Any,
+        ttl: float = WEATHER_CACHE_TTL,
+    ) -> None:
+        if ttl <= 0:
+            return
+        with cls._cache_lock:
+            if len(cls._response_cache) >= WEATHER_CACHE_SIZE:
+                # Evict the oldest entry; dicts keep insertion order
+                cls._response_cache.pop(next(iter(cls._response_cache)), None)
+            cls._response_cache[key] = (time.monotonic(), response)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached weather responses"""
+        with cls._cache_lock:
+            cls._response_cache.clear()
+
     def __init__(self, api_key: Optional[str] = None) -> None:
         try:
             self.api_key: str = api_key or config("WEATHER_API_KEY")
@@ -45,14 +148,22 @@ class WeatherAPI:
         except Exception as e:
             logger.error(f"Failed to initialize WeatherAPI: {e}")
             raise ValueError("Failed to initialize WeatherAPI") from e
+        self.session: requests.Session = _build_session()
 
     def get_weather(
         self, location: str, date: Optional[str] = None
     ) -> Optional[WeatherResponse]:
+        query, location_key = _normalize_location(location)
+        cache_key = ("weather", location_key, date)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached weather for {location}")
+            return cast(WeatherResponse, cached)
+
         try:
             endpoint: str = "forecast.json"
             params: dict[str, Union[str, int]] = {
-                "q": location,
+                "q": query,
                 "key": self.api_key,
                 "days": 7,
                 "aqi": "yes",
@@ -64,12 +175,14 @@ class WeatherAPI:
                 params["dt"] = date
 
             request_url: str = f"{WEATHER_URL}{endpoint}"
-            response: requests.Response = requests.get(
+            response: requests.Response = self.session.get(
                 request_url, params=params, timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
 
-            return cast(WeatherResponse, response.json())
+            weather = cast(WeatherResponse, response.json())
+            self._store_cached(cache_key, weather)
+            return weather
         except requests.exceptions.Timeout:
             logger.error("Weather API request timed out")
             print("Weather service is taking too long to respond. Please try again.")
@@ -84,24 +197,33 @@ class WeatherAPI:
             return None
 
     def get_forecast(self, location: str, days: int = 7) -> Optional[WeatherResponse]:
-        try:
-            # Ensure days is within valid range
-            valid_days: int = max(1, min(days, 7))
+        # Ensure days is within valid range
+        valid_days: int = max(1, min(days, 7))
+
+        query, location_key = _normalize_location(location)
+        cache_key = ("forecast", location_key, valid_days)
+        cached = self._get_cached(cache_key, FORECAST_CACHE_TTL)
+        if cached is not None:
+            logger.debug(f"Using cached forecast for {location}")
+            return cast(WeatherResponse, cached)
 
+        try:
             params: dict[str, Union[str, int]] = {
-                "q": location,
+                "q": query,
                 "key": self.api_key,
                 "days": valid_days,
                 "aqi": "no",
             }
 
             request_url: str = f"{WEATHER_URL}forecast.json"
-            response: requests.Response = requests.get(
+            response: requests.Response = self.session.get(
                 request_url, params=params, timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
 
-            return cast(WeatherResponse, response.json())
+            forecast = cast(WeatherResponse, response.json())
+            self._store_cached(cache_key, forecast, FORECAST_CACHE_TTL)
+            return forecast
         except requests.exceptions.Timeout:
             logger.error("Forecast API request timed out")
             print("Forecast service is taking too long to respond. Please try again.")
@@ -116,16 +238,24 @@ class WeatherAPI:
             return None
 
     def search_city(self, query: str) -> Optional[list[CitySearchResult]]:
+        cache_key = ("search", query.strip().lower())
+        cached = self._get_cached(cache_key, SEARCH_CACHE_TTL)
+        if cached is not None:
+            logger.debug(f"Using cached search results for {query}")
+            return cast(list[CitySearchResult], cached)
+
         try:
             params: dict[str, str] = {"q": query, "key": self.api_key}
             request_url: str = f"{WEATHER_URL}search.json"
 
-            response: requests.Response = requests.get(
+            response: requests.Response = self.session.get(
                 request_url, params=params, timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
 
-            return cast(list[CitySearchResult], response.json())
+            results = cast(list[CitySearchResult], response.json())
+            self._store_cached(cache_key, results, SEARCH_CACHE_TTL)
+            return results
         except requests.exceptions.Timeout:
             logger.error("City search API request timed out")
             print("City search is taking too long to respond. Please try again.")
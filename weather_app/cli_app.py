@@ -3,6 +3,8 @@ import logging
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import inspect
+
 from .api import WeatherAPI
 from .current import CurrentWeatherManager
 from .database import Database
@@ -16,6 +18,8 @@ from .user_input import User_Input_Information
 
 logger = logging.getLogger("weather_app")
 
+_LOCATION_COLUMNS = tuple(inspect(Location).columns.keys())
+
 
 class WeatherApp:
     def __init__(self):
@@ -38,19 +42,11 @@ class WeatherApp:
         Create a fresh Location object detached from any session.
         This helps avoid SQLAlchemy session issues.
         """
-        return Location(
-            id=location.id,
-            name=location.name,
-            latitude=location.latitude,
-            longitude=location.longitude,
-            country=location.country,
-            region=location.region,
-            is_favorite=location.is_favorite,
-            created_at=datetime.now()
-            if not hasattr(location, "created_at")
-            else location.created_at,
-            updated_at=datetime.now(),
-        )
+        values = {key: getattr(location, key, None) for key in _LOCATION_COLUMNS}
+        now = datetime.now()
+        values["created_at"] = values["created_at"] or now
+        values["updated_at"] = now
+        return Location(**values)
 
     def refresh_location(self, location: Location) -> Optional[Location]:
         try:
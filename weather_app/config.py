@@ -25,6 +25,17 @@ DEFAULT_DATABASE_URL = f"sqlite:///{DEFAULT_DB_PATH}"
 # Load DATABASE_URL with fallback to default
 DATABASE_URL = config("DATABASE_URL", default=DEFAULT_DATABASE_URL, cast=str)
 
+# Connection pool settings (ignored for in-memory SQLite)
+DB_POOL_SIZE = config("DB_POOL_SIZE", default=10, cast=int)
+DB_MAX_OVERFLOW = config("DB_MAX_OVERFLOW", default=20, cast=int)
+DB_POOL_RECYCLE = config("DB_POOL_RECYCLE", default=1800, cast=int)
+DB_POOL_TIMEOUT = config("DB_POOL_TIMEOUT", default=10, cast=int)
+
+# Seconds a process reuses its list of favorite locations. Writes made through
+# LocationRepository clear it at once, and each reuse first checks a cheap
+# version query so changes from other processes show up. 0 disables caching.
+FAVORITES_CACHE_TTL = config("FAVORITES_CACHE_TTL", default=60.0, cast=float)
+
 # Optional: Provide other configuration with fallbacks
 WEATHER_API_KEY = config("WEATHER_API_KEY", default="")
 SECRET_KEY = config("SECRET_KEY", default="dev-key-change-in-production")
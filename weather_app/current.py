@@ -12,6 +12,7 @@ from .display import WeatherDisplay
 from .models import Location, UserSettings, WeatherRecord
 from .repository import LocationRepository, SettingsRepository, WeatherRepository
 from .weather_types import (
+    VALID_UNITS,
     CurrentWeather,
     TemperatureUnit,
     WeatherCondition,
@@ -106,7 +107,7 @@ class CurrentWeatherManager:
         try:
             # Validate unit value
             valid_unit: str = temperature_unit.upper()
-            if valid_unit not in ["C", "F"]:
+            if valid_unit not in VALID_UNITS:
                 self.display.show_error("Invalid temperature unit. Use 'C' or 'F'.")
                 return
 
@@ -126,28 +127,33 @@ class CurrentWeatherManager:
         except Exception as e:
             self.display.show_error(f"Failed to update temperature unit: {e}")
 
+    @staticmethod
+    def _build_weather_record(
+        location: Location, weather_data: WeatherData
+    ) -> WeatherRecord:
+        """Build an unsaved WeatherRecord from an API response"""
+        # Extract current weather from API response
+        current: CurrentWeather = weather_data.get("current", {})
+        condition_obj: WeatherCondition = current.get("condition", {})
+
+        return WeatherRecord(
+            location_id=location.id,
+            timestamp=datetime.now(),
+            temperature=current.get("temp_c", 0.0),
+            feels_like=current.get("feelslike_c", 0.0),
+            humidity=current.get("humidity", 0),
+            pressure=current.get("pressure_mb", 0.0),
+            wind_speed=current.get("wind_kph", 0.0),
+            wind_direction=current.get("wind_dir", ""),
+            condition=condition_obj.get("text", "Unknown"),
+            condition_description=condition_obj.get("text", "Unknown"),
+        )
+
     def _save_weather_record(
         self, location: Location, weather_data: WeatherData
     ) -> WeatherRecord | None:
         try:
-            # Extract current weather from API response
-            current: CurrentWeather = weather_data.get("current", {})
-            condition_obj: WeatherCondition = current.get("condition", {})
-
-            # Create WeatherRecord object
-            record: WeatherRecord = WeatherRecord(
-                location_id=location.id,
-                timestamp=datetime.now(),
-                temperature=current.get("temp_c", 0.0),
-                feels_like=current.get("feelslike_c", 0.0),
-                humidity=current.get("humidity", 0),
-                pressure=current.get("pressure_mb", 0.0),
-                wind_speed=current.get("wind_kph", 0.0),
-                wind_direction=current.get("wind_dir", ""),
-                condition=condition_obj.get("text", "Unknown"),
-                condition_description=condition_obj.get("text", "Unknown"),
-            )
-
+            record = self._build_weather_record(location, weather_data)
             return self.weather_repo.create(record)
         except Exception as e:
             self.display.show_error(f"Failed to save weather data: {e}")
@@ -3,12 +3,18 @@ import os
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, TypeVar
+from typing import Any, Optional, TypeVar
 
 from sqlalchemy.engine import Engine
 from sqlmodel import Session, SQLModel, create_engine
 
-from .config import DATABASE_URL
+from .config import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
 
 T = TypeVar("T", bound=SQLModel)
 
@@ -35,7 +41,23 @@ class Database:
     def _initialize_db(cls) -> None:
         """Initialize the database engine with appropriate settings."""
         # create another @classmethod to create the database from scratch
-        cls._engine = create_engine(DATABASE_URL)
+        cls._engine = create_engine(DATABASE_URL, **cls._pool_options())
+
+    @classmethod
+    def _pool_options(cls) -> dict[str, Any]:
+        """Return connection pool settings for the configured database."""
+        if DATABASE_URL in ("sqlite://", "sqlite:///:memory:"):
+            # In-memory SQLite uses a single connection per thread, no queue pool
+            return {}
+        return {
+            "pool_use_lifo": True,
+            "pool_pre_ping": True,
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_recycle": DB_POOL_RECYCLE,
+            # Fail fast rather than queueing behind a saturated pool
+            "pool_timeout": DB_POOL_TIMEOUT,
+        }
 
     @classmethod
     def create_tables(cls) -> None:
@@ -57,8 +79,11 @@ class Database:
 
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
-        """Context-managed session generator."""
-        with Session(self.get_engine()) as session:
+        """Context-managed session generator.
+
+        Instances stay loaded after commit so they can be detached and returned.
+        """
+        with Session(self.get_engine(), expire_on_commit=False) as session:
             yield session
 
     @classmethod
@@ -81,5 +106,5 @@ def init_db() -> "Database":
 
 def get_session() -> Generator[Session, None, None]:
     """Yield a session using the global database engine."""
-    with Session(Database.get_engine()) as session:
+    with Session(Database.get_engine(), expire_on_commit=False) as session:
         yield session
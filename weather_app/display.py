@@ -36,18 +36,21 @@ class WeatherDisplay:
             print("No city found.")
             return
 
-        print("\n📍 Found cities:")
-        print("=" * 50)
-
+        lines = ["\n📍 Found cities:", "=" * 50]
         for i, location in enumerate(city, 1):
             logger.debug(f"City {i}: {location['name']}")
-            print(
-                f"{i}. {location['name']}, {location.get('region', 'N/A')}, "
-                f"{location['country']}"
+            lines.extend(
+                (
+                    f"{i}. {location['name']}, {location.get('region', 'N/A')}, "
+                    f"{location['country']}",
+                    f"   Lat: {location['lat']}, Lon: {location['lon']}",
+                    f"   URL: {location.get('url', 'N/A')}",
+                    "-" * 50,
+                )
             )
-            print(f"   Lat: {location['lat']}, Lon: {location['lon']}")
-            print(f"   URL: {location.get('url', 'N/A')}")
-            print("-" * 50)
+
+        # Print the whole block at once rather than one call per line
+        print("\n".join(lines))
 
     @staticmethod
     def show_current_weather(
@@ -65,20 +68,19 @@ class WeatherDisplay:
         condition_text = current["condition"]["text"]
         emoji = get_weather_emoji(condition_text)
 
+        # Display temperature based on unit preference
+        if unit == "F":
+            temp, feels_like, symbol = current["temp_f"], current["feelslike_f"], "°F"
+        else:
+            temp, feels_like, symbol = current["temp_c"], current["feelslike_c"], "°C"
+
         print(
             f"\nWeather in 📍 {location['name']}, {location['region']}, "
             f"{location['country']}:"
         )
         print(f"{emoji} {condition_text}")
-
-        # Display temperature based on unit preference
-        if unit == "F":
-            print(f"🌡️ Temperature: {current['temp_f']}°F")
-            print(f"🌡️ Feels like: {current['feelslike_f']}°F")
-        else:
-            print(f"🌡️ Temperature: {current['temp_c']}°C")
-            print(f"🌡️ Feels like: {current['feelslike_c']}°C")
-
+        print(f"🌡️ Temperature: {temp}{symbol}")
+        print(f"🌡️ Feels like: {feels_like}{symbol}")
         print(f"💧 Humidity: {current['humidity']}%")
         print(
             f"💨 Wind: {current['wind_kph']} kph / {current['wind_mph']} mph, "
@@ -121,8 +123,13 @@ class WeatherDisplay:
 
         # Display the forecast header with actual number of days
         num_days = len(forecast_days)
-        print(f"\n🗓️ {num_days}-Day Weather Forecast:")
-        print("=" * 40)
+        lines = [f"\n🗓️ {num_days}-Day Weather Forecast:", "=" * 40]
+
+        # Resolve the unit-specific keys once rather than for every day
+        if unit.upper() == "F":
+            max_key, min_key, symbol = "maxtemp_f", "mintemp_f", "°F"
+        else:
+            max_key, min_key, symbol = "maxtemp_c", "mintemp_c", "°C"
 
         for day in forecast_days:
             # Skip if day data structure is invalid
@@ -138,34 +145,34 @@ class WeatherDisplay:
                 condition_text = day_data.get("condition", {}).get("text", "Unknown")
                 emoji = get_weather_emoji(condition_text)
 
-                print(f"\n📅 Date: {date}")
-                print(f"{emoji} {condition_text}")
-
-                # Display temperature based on unit preference
-                if unit.upper() == "F":
-                    print(f"🌡️ Max: {day_data.get('maxtemp_f', 'N/A')}°F")
-                    print(f"🌡️ Min: {day_data.get('mintemp_f', 'N/A')}°F")
-                else:
-                    print(f"🌡️ Max: {day_data.get('maxtemp_c', 'N/A')}°C")
-                    print(f"🌡️ Min: {day_data.get('mintemp_c', 'N/A')}°C")
-
                 # Handle optional forecast fields
                 chance_of_rain = day_data.get("daily_chance_of_rain", "N/A")
                 chance_of_snow = day_data.get("daily_chance_of_snow", "N/A")
                 sunrise = astro.get("sunrise", "N/A")
                 sunset = astro.get("sunset", "N/A")
 
-                print(f"☔ Chance of rain: {chance_of_rain}%")
-                print(f"❄️ Chance of snow: {chance_of_snow}%")
-                print(f"🌄 Sunrise: {sunrise} | 🌇 Sunset: {sunset}")
-                print("-" * 40)
+                lines.extend(
+                    (
+                        f"\n📅 Date: {date}",
+                        f"{emoji} {condition_text}",
+                        f"🌡️ Max: {day_data.get(max_key, 'N/A')}{symbol}",
+                        f"🌡️ Min: {day_data.get(min_key, 'N/A')}{symbol}",
+                        f"☔ Chance of rain: {chance_of_rain}%",
+                        f"❄️ Chance of snow: {chance_of_snow}%",
+                        f"🌄 Sunrise: {sunrise} | 🌇 Sunset: {sunset}",
+                        "-" * 40,
+                    )
+                )
             except Exception as e:
                 logger.error(f"Error displaying forecast day: {e}")
-                print(
+                lines.append(
                     f"❌ Error displaying forecast for "
                     f"{day.get('date', 'unknown date')}"
                 )
 
+        # Print the whole block at once rather than one call per line
+        print("\n".join(lines))
+
     @staticmethod
     def show_historical_weather(
         weather_data: Optional[dict[str, Any]], date_str: str
@@ -1,23 +1,28 @@
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger("weather_app")
 
+# Checked in order; the first keyword found in the condition text wins
+EMOJI_MAP = {
+    "sunny": "☀️",
+    "cloud": "☁️",
+    "rain": "🌧️",
+    "drizzle": "🌧️",
+    "thunder": "⛈️",
+    "snow": "❄️",
+    "fog": "🌫️",
+    "mist": "🌫️",
+    "clear": "🌕",
+    "wind": "🌬️",
+}
+DEFAULT_EMOJI = "🌈"
 
+
+@lru_cache(maxsize=128)
 def get_weather_emoji(condition: str) -> str:
     condition = condition.lower()
-    emoji_map = {
-        "sunny": "☀️",
-        "cloud": "☁️",
-        "rain": "🌧️",
-        "drizzle": "🌧️",
-        "thunder": "⛈️",
-        "snow": "❄️",
-        "fog": "🌫️",
-        "mist": "🌫️",
-        "clear": "🌕",
-        "wind": "🌬️",
-    }
-    for key, emoji in emoji_map.items():
+    for key, emoji in EMOJI_MAP.items():
         if key in condition:
             return emoji
-    return "🌈"
+    return DEFAULT_EMOJI
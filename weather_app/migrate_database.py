@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 """
 Database migration script to update the schema with new fields.
-Specifically adds the forecast_days column to the UserSettings table.
+Adds the forecast_days column to the UserSettings table, the
+geohash_bucket column (with its index) to the Location table and the
+location_fts full-text search index.
 """
 
 import datetime
@@ -12,8 +14,10 @@ import sys
 from pathlib import Path
 
 from sqlalchemy import text
+from sqlmodel import Session
 
 from weather_app.database import Database
+from weather_app.models import LOCATION_FTS_DDL, coordinate_bucket
 
 # Add parent directory to path to import weather_app modules
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -104,6 +108,10 @@ def migrate_database():
                             "✅ Updated forecast_days from 5 to 7 to match new application default"
                         )
 
+            migrate_location_buckets(session)
+            migrate_location_search(session)
+            migrate_weather_record_index(session)
+
             return True
     except Exception as e:
         logger.error(f"Migration failed: {e}", exc_info=True)
@@ -111,6 +119,68 @@ def migrate_database():
         return False
 
 
+def migrate_location_buckets(session: Session) -> None:
+    """Add and backfill the geohash_bucket column used for coordinate lookups"""
+    columns = session.execute(text("PRAGMA table_info(location)"))
+    column_names = [column[1] for column in columns]
+
+    if "geohash_bucket" not in column_names:
+        logger.info("Adding 'geohash_bucket' column to Location table")
+        session.execute(text("ALTER TABLE location ADD COLUMN geohash_bucket INTEGER"))
+        session.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_location_geohash_bucket "
+                "ON location (geohash_bucket)"
+            )
+        )
+        session.commit()
+        print("✅ Successfully added 'geohash_bucket' column to Location table")
+
+    rows = session.execute(
+        text(
+            "SELECT id, latitude, longitude FROM location WHERE geohash_bucket IS NULL"
+        )
+    ).all()
+    for location_id, latitude, longitude in rows:
+        session.execute(
+            text("UPDATE location SET geohash_bucket = :bucket WHERE id = :id"),
+            {"bucket": coordinate_bucket(latitude, longitude), "id": location_id},
+        )
+    if rows:
+        session.commit()
+        logger.info(f"Backfilled geohash_bucket for {len(rows)} locations")
+        print(f"✅ Backfilled geohash_bucket for {len(rows)} locations")
+
+
+def migrate_location_search(session: Session) -> None:
+    """Create and populate the full-text index used by location search"""
+    exists = session.execute(
+        text("SELECT name FROM sqlite_master WHERE name = 'location_fts'")
+    ).first()
+    if exists:
+        logger.info("The location_fts search index already exists")
+        return
+
+    logger.info("Creating location_fts search index")
+    for statement in LOCATION_FTS_DDL:
+        session.execute(text(statement))
+    session.execute(text("INSERT INTO location_fts(location_fts) VALUES ('rebuild')"))
+    session.commit()
+    print("✅ Created full-text search index for locations")
+
+
+def migrate_weather_record_index(session: Session) -> None:
+    """Create the composite index used for per-location weather history"""
+    session.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_weatherrecord_location_id_timestamp "
+            "ON weatherrecord (location_id, timestamp)"
+        )
+    )
+    session.commit()
+    logger.info("Ensured ix_weatherrecord_location_id_timestamp index exists")
+
+
 def create_backup():
     """Create a backup of the database before migration"""
     try:
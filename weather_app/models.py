@@ -1,6 +1,8 @@
+import math
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+from sqlalchemy import DDL, Index, event
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -8,6 +10,32 @@ if TYPE_CHECKING:
     pass
 
 
+# Size of a coordinate bucket in degrees (matches the default lookup threshold)
+COORDINATE_BUCKET_SIZE = 0.01
+LONGITUDE_BUCKETS = int(round(360 / COORDINATE_BUCKET_SIZE))
+
+
+def coordinate_bucket(latitude: float, longitude: float) -> int:
+    """Pack the grid cell containing the coordinates into a single integer key"""
+    lat_index = math.floor((latitude + 90) / COORDINATE_BUCKET_SIZE)
+    lon_index = math.floor((longitude + 180) / COORDINATE_BUCKET_SIZE)
+    return lat_index * LONGITUDE_BUCKETS + lon_index % LONGITUDE_BUCKETS
+
+
+def neighboring_buckets(
+    latitude: float, longitude: float, threshold: float = COORDINATE_BUCKET_SIZE
+) -> list[int]:
+    """Return the bucket keys that may hold a point within threshold degrees"""
+    span = max(1, math.ceil(threshold / COORDINATE_BUCKET_SIZE))
+    lat_index = math.floor((latitude + 90) / COORDINATE_BUCKET_SIZE)
+    lon_index = math.floor((longitude + 180) / COORDINATE_BUCKET_SIZE)
+    return [
+        (lat_index + dlat) * LONGITUDE_BUCKETS + (lon_index + dlon) % LONGITUDE_BUCKETS
+        for dlat in range(-span, span + 1)
+        for dlon in range(-span, span + 1)
+    ]
+
+
 class Location(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(index=True)
@@ -18,6 +46,7 @@ class Location(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     is_favorite: bool = Field(default=False, index=True)
+    geohash_bucket: Optional[int] = Field(default=None, index=True)
 
     # Relationships
     weather_records: list["WeatherRecord"] = Relationship(back_populates="location")
@@ -42,7 +71,66 @@ class Location(SQLModel, table=True):
         }
 
 
+@event.listens_for(Location, "before_insert")
+@event.listens_for(Location, "before_update")
+def _set_geohash_bucket(mapper: Any, connection: Any, target: Location) -> None:
+    """Keep the coordinate bucket in sync with latitude/longitude"""
+    target.geohash_bucket = coordinate_bucket(target.latitude, target.longitude)
+
+
+# Full-text index over the searchable location columns. SQLite keeps an FTS5
+# table in sync through triggers; PostgreSQL uses a GIN expression index.
+LOCATION_SEARCH_VECTOR = (
+    "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(country, '') "
+    "|| ' ' || coalesce(region, ''))"
+)
+
+LOCATION_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS location_fts USING fts5("
+    "name, country, region, content='location', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS location_fts_ai AFTER INSERT ON location BEGIN "
+    "INSERT INTO location_fts(rowid, name, country, region) "
+    "VALUES (new.id, new.name, new.country, new.region); END",
+    "CREATE TRIGGER IF NOT EXISTS location_fts_ad AFTER DELETE ON location BEGIN "
+    "INSERT INTO location_fts(location_fts, rowid, name, country, region) "
+    "VALUES ('delete', old.id, old.name, old.country, old.region); END",
+    "CREATE TRIGGER IF NOT EXISTS location_fts_au "
+    "AFTER UPDATE OF name, country, region ON location BEGIN "
+    "INSERT INTO location_fts(location_fts, rowid, name, country, region) "
+    "VALUES ('delete', old.id, old.name, old.country, old.region); "
+    "INSERT INTO location_fts(rowid, name, country, region) "
+    "VALUES (new.id, new.name, new.country, new.region); END",
+]
+
+_location_table = SQLModel.metadata.tables["location"]
+for _statement in LOCATION_FTS_DDL:
+    event.listen(
+        _location_table,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+event.listen(
+    _location_table,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS location_fts").execute_if(dialect="sqlite"),
+)
+event.listen(
+    _location_table,
+    "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_location_search "
+        f"ON location USING gin ({LOCATION_SEARCH_VECTOR})"
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class WeatherRecord(SQLModel, table=True):
+    # Serves "latest records for a location" straight from the index; the
+    # timestamp is read backwards, so no DESC column is needed
+    __table_args__ = (
+        Index("ix_weatherrecord_location_id_timestamp", "location_id", "timestamp"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     location_id: int = Field(foreign_key="location.id", index=True)
     timestamp: datetime = Field(default_factory=datetime.now, index=True)
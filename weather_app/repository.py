@@ -1,20 +1,64 @@
 import logging
+import re
+import time
 from datetime import datetime, timedelta
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Generic, Optional, TypeVar, cast
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Integer, column, exists, insert, literal, text
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.orm import aliased, make_transient
 from sqlalchemy.orm.exc import DetachedInstanceError
 from sqlalchemy.sql.expression import func
 from sqlmodel import Session, SQLModel, col, or_, select
+from sqlmodel.sql.expression import SelectOfScalar
 
+from weather_app.config import FAVORITES_CACHE_TTL
 from weather_app.database import Database
 from weather_app.exceptions import DatabaseError
 from weather_app.exceptions import DetachedInstanceError as AppDetachedError
-from weather_app.models import Location, UserSettings, WeatherRecord
+from weather_app.models import (
+    COORDINATE_BUCKET_SIZE,
+    LOCATION_SEARCH_VECTOR,
+    Location,
+    UserSettings,
+    WeatherRecord,
+    coordinate_bucket,
+    neighboring_buckets,
+)
+
+logger = logging.getLogger(__name__)
 
 # Generic type variable for models
 T = TypeVar("T", bound=SQLModel)
 
+# Words of a location search query, each matched as a full-text prefix
+_SEARCH_TERM_PATTERN = re.compile(r"\w+")
+
+
+def _fetch_all(session: Session, statement: SelectOfScalar[T]) -> list[T]:
+    """Run a select and return its rows (ScalarResult.all() is already a list)"""
+    return cast(list[T], session.exec(statement).all())
+
+
+def _favorites_version(session: Session) -> tuple[int, Optional[datetime]]:
+    """Count and latest update of the favorite locations
+
+    Repository writes bump updated_at, so this changes whenever a favorite is
+    added, removed, renamed or deleted in any process.
+    """
+    statement = select(func.count(), func.max(Location.updated_at)).where(
+        col(Location.is_favorite).is_(True)
+    )
+    count, updated_at = session.execute(statement).one()
+    return count, updated_at
+
+
+def _detach(session: Session, obj: T) -> T:
+    """Detach a loaded instance from its session so it can be returned safely"""
+    session.expunge(obj)
+    make_transient(obj)
+    return obj
+
 
 class BaseRepository(Generic[T]):
     """Base repository class with common CRUD operations"""
@@ -32,6 +76,36 @@ class BaseRepository(Generic[T]):
             session.refresh(obj)
             return obj
 
+    def bulk_create(self, objs: list[T]) -> int:
+        """Insert many records in executemany batches within one transaction
+
+        Goes through a Core-level insert so the unit of work is skipped; the
+        objects themselves are not refreshed with their new IDs.
+        """
+        if not objs:
+            return 0
+
+        # Every row of an executemany batch needs the same columns, so rows
+        # whose ID is unset (left for the database to assign) go in their own
+        # batch rather than dropping the IDs that callers did set
+        rows = [obj.model_dump() for obj in objs]
+        with_ids = [row for row in rows if row.get("id") is not None]
+        without_ids = [
+            {key: value for key, value in row.items() if key != "id"}
+            for row in rows
+            if row.get("id") is None
+        ]
+        try:
+            with self.db.get_session() as session:
+                for batch in (with_ids, without_ids):
+                    if batch:
+                        session.execute(insert(self.model_class), batch)
+                session.commit()
+                return len(rows)
+        except SQLAlchemyError as e:
+            error_msg = f"Failed to bulk create {self.model_class.__name__}s: {e}"
+            raise DatabaseError(error_msg) from e
+
     def get_by_id(self, id: int) -> Optional[T]:
         """Get a record by ID"""
         try:
@@ -46,8 +120,7 @@ class BaseRepository(Generic[T]):
         try:
             with self.db.get_session() as session:
                 statement = select(self.model_class).offset(offset).limit(limit)
-                results = session.exec(statement).all()
-                return list(results)
+                return _fetch_all(session, statement)
         except SQLAlchemyError as e:
             error_msg = f"Failed to get all {self.model_class.__name__}s: {e}"
             raise DatabaseError(error_msg) from e
@@ -96,7 +169,7 @@ class BaseRepository(Generic[T]):
         try:
             with self.db.get_session() as session:
                 statement = select(func.count()).select_from(self.model_class)
-                return session.exec(statement).one()
+                return session.scalar(statement) or 0
         except SQLAlchemyError as e:
             error_msg = f"Failed to count {self.model_class.__name__}s: {e}"
             raise DatabaseError(error_msg) from e
@@ -107,46 +180,179 @@ class LocationRepository(BaseRepository[Location]):
 
     model_class = Location
 
+    # Process-local snapshot of the favorite locations, shared by all instances,
+    # with the version of the favorites it was read at
+    _favorites_cache: Optional[list[Location]] = None
+    _favorites_cached_at: float = 0.0
+    _favorites_version: tuple[int, Optional[datetime]] = (0, None)
+    # Bumped by every invalidation; a read only caches what it loaded if no
+    # write committed while it was running
+    _favorites_generation: int = 0
+    # Cleared the first time the full-text index turns out to be missing, so an
+    # unmigrated database falls back to LIKE with one warning, not one per search
+    _full_text_search: bool = True
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop the cached favorites so the next read goes to the database"""
+        cls._favorites_generation += 1
+        cls._favorites_cache = None
+
+    # Writes drop the cache once they have committed, so a read that runs
+    # during the write cannot cache the old list after the invalidation
+    def create(self, obj: Location) -> Location:
+        try:
+            return super().create(obj)
+        finally:
+            self.invalidate_cache()
+
+    def bulk_create(self, objs: list[Location]) -> int:
+        """Insert many locations, filling in their coordinate buckets"""
+        # Mapper events do not fire for bulk inserts
+        for obj in objs:
+            obj.geohash_bucket = coordinate_bucket(obj.latitude, obj.longitude)
+        try:
+            return super().bulk_create(objs)
+        finally:
+            self.invalidate_cache()
+
+    def update(self, id: int, data: dict[str, Any]) -> Optional[Location]:
+        try:
+            return super().update(id, data)
+        finally:
+            self.invalidate_cache()
+
+    def delete(self, id: int) -> bool:
+        try:
+            return super().delete(id)
+        finally:
+            self.invalidate_cache()
+
     def search(self, query: str, limit: int = 10) -> list[Location]:
-        """Search locations by name, region, or country"""
+        """Search locations by name, region, or country
+
+        Every word of the query must start a word of the location, so "york"
+        finds New York but "ork" does not. Without a full-text index the
+        search falls back to substring matching.
+        """
+        terms = _SEARCH_TERM_PATTERN.findall(query)
+        if not terms:
+            return []
+
         try:
-            search_term = f"%{query}%"
             with self.db.get_session() as session:
-                statement = (
-                    select(Location)
-                    .where(
-                        or_(
-                            col(Location.name).ilike(search_term),
-                            col(Location.country).ilike(search_term),
-                            col(Location.region).ilike(search_term),
+                dialect = session.get_bind().dialect.name
+                condition: Any
+                full_text = LocationRepository._full_text_search
+                if not full_text:
+                    condition = self._ilike_condition(query)
+                elif dialect == "sqlite":
+                    fts_query = " ".join(f'"{term}"*' for term in terms)
+                    matches = (
+                        text(
+                            "SELECT rowid FROM location_fts "
+                            "WHERE location_fts MATCH :query"
                         )
+                        .bindparams(query=fts_query)
+                        .columns(column("rowid", Integer))
                     )
-                    .limit(limit)
-                )
-                results = session.exec(statement).all()
-                return list(results)
+                    condition = col(Location.id).in_(matches)
+                elif dialect == "postgresql":
+                    ts_query = " & ".join(f"{term}:*" for term in terms)
+                    condition = text(
+                        f"{LOCATION_SEARCH_VECTOR} @@ to_tsquery('simple', :query)"
+                    ).bindparams(query=ts_query)
+                else:
+                    condition = self._ilike_condition(query)
+
+                statement = select(Location).where(condition).limit(limit)
+                try:
+                    return _fetch_all(session, statement)
+                except OperationalError as e:
+                    # Databases created before the search index was added
+                    if not full_text:
+                        raise
+                    logger.warning(f"Full-text search unavailable, using LIKE: {e}")
+                    LocationRepository._full_text_search = False
+                    session.rollback()
+                    statement = (
+                        select(Location)
+                        .where(self._ilike_condition(query))
+                        .limit(limit)
+                    )
+                    return _fetch_all(session, statement)
         except SQLAlchemyError as e:
             error_msg = f"Failed to search locations: {e}"
             raise DatabaseError(error_msg) from e
 
-    def get_favorites(self) -> list[Location]:
-        """Get favorite locations"""
+    @staticmethod
+    def _ilike_condition(query: str) -> Any:
+        search_term = f"%{query}%"
+        return or_(
+            col(Location.name).ilike(search_term),
+            col(Location.country).ilike(search_term),
+            col(Location.region).ilike(search_term),
+        )
+
+    def get_favorites(
+        self, version: Optional[tuple[int, Optional[datetime]]] = None
+    ) -> list[Location]:
+        """Get favorite locations
+
+        A caller that has just read get_favorites_version() can pass it in, so a
+        cache hit is checked against it without querying the version again.
+        """
+        cls = LocationRepository
+        generation = cls._favorites_generation
+        cached = cls._favorites_cache
+        if (
+            cached is not None
+            and time.monotonic() - cls._favorites_cached_at >= FAVORITES_CACHE_TTL
+        ):
+            cached = None
+
+        if cached is not None and version is not None:
+            if version == cls._favorites_version:
+                return list(cached)
+            cached = None
+
         try:
             with self.db.get_session() as session:
+                if cached is not None:
+                    # Other worker processes change favorites without clearing
+                    # this cache, so compare a cheap version of them first
+                    if _favorites_version(session) == cls._favorites_version:
+                        return list(cached)
+
                 statement = select(Location).where(Location.is_favorite.is_(True))
-                results = session.exec(statement).all()
-                return list(results)
+                favorites = _fetch_all(session, statement)
         except SQLAlchemyError as e:
             error_msg = f"Failed to get favorite locations: {e}"
             raise DatabaseError(error_msg) from e
 
+        if FAVORITES_CACHE_TTL > 0 and generation == cls._favorites_generation:
+            cls._favorites_cache = favorites
+            cls._favorites_cached_at = time.monotonic()
+            cls._favorites_version = (
+                len(favorites),
+                max((location.updated_at for location in favorites), default=None),
+            )
+        return list(favorites)
+
+    def get_favorites_version(self) -> tuple[int, Optional[datetime]]:
+        """Return a cheap version stamp that changes with the favorites"""
+        try:
+            with self.db.get_session() as session:
+                return _favorites_version(session)
+        except SQLAlchemyError as e:
+            error_msg = f"Failed to get favorite locations version: {e}"
+            raise DatabaseError(error_msg) from e
+
     def find_by_coordinates(
         self, latitude: float, longitude: float, threshold: float = 0.01
     ) -> Optional[Location]:
         """Find location by approximate coordinates within a threshold"""
 
-        logger = logging.getLogger("weather_app")
-
         logger.debug(
             f"Searching for location with coordinates: {latitude}, {longitude} "
             f"(threshold: {threshold})"
@@ -174,17 +380,22 @@ class LocationRepository(BaseRepository[Location]):
                 )
                 location = session.exec(statement).first()
 
-                # If not found, try with threshold
+                # If not found, look in the surrounding coordinate buckets
+                # (indexed equality lookup) and apply the exact threshold here
                 if not location:
-                    statement = (
-                        select(Location)
-                        .where(
-                            (func.abs(Location.latitude - latitude) < threshold)
-                            & (func.abs(Location.longitude - longitude) < threshold)
-                        )
-                        .limit(1)
+                    buckets = neighboring_buckets(latitude, longitude, threshold)
+                    statement = select(Location).where(
+                        col(Location.geohash_bucket).in_(buckets)
+                    )
+                    location = next(
+                        (
+                            candidate
+                            for candidate in session.exec(statement)
+                            if abs(candidate.latitude - latitude) < threshold
+                            and abs(candidate.longitude - longitude) < threshold
+                        ),
+                        None,
                     )
-                    location = session.exec(statement).first()
 
                 # Log search results
                 if location:
@@ -193,29 +404,30 @@ class LocationRepository(BaseRepository[Location]):
                         f"at {location.latitude}, {location.longitude}"
                     )
 
-                    # Create a copy with all required attributes to avoid session issues
-                    return self._create_detached_location_copy(location)
+                    return _detach(session, location)
                 else:
                     logger.debug(
                         f"No location found with coordinates {latitude}, {longitude} "
                         f"(threshold: {threshold})"
                     )
 
-                    # If no match with threshold, log available locations for debugging
-                    all_locations_stmt = select(Location).limit(5)
-                    sample_locations = session.exec(all_locations_stmt).all()
-                    if sample_locations:
-                        logger.debug(
-                            f"Sample locations in database "
-                            f"({len(sample_locations)} shown):"
-                        )
-                        for loc in sample_locations:
+                    # If no match with threshold, log available locations for
+                    # debugging (skip the extra query unless DEBUG is enabled)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        all_locations_stmt = select(Location).limit(5)
+                        sample_locations = session.exec(all_locations_stmt).all()
+                        if sample_locations:
                             logger.debug(
-                                f"  - {loc.name} (ID: {loc.id}): "
-                                f"{loc.latitude}, {loc.longitude}"
+                                f"Sample locations in database "
+                                f"({len(sample_locations)} shown):"
                             )
-                    else:
-                        logger.debug("No locations exist in database")
+                            for loc in sample_locations:
+                                logger.debug(
+                                    f"  - {loc.name} (ID: {loc.id}): "
+                                    f"{loc.latitude}, {loc.longitude}"
+                                )
+                        else:
+                            logger.debug("No locations exist in database")
 
                     return None
 
@@ -240,9 +452,12 @@ class LocationRepository(BaseRepository[Location]):
         country: str = "Unknown",
         region: Optional[str] = None,
     ) -> Location:
-        """Find a location by coordinates or create it if it doesn't exist"""
+        """Find a location by coordinates or create it if it doesn't exist
 
-        logger = logging.getLogger("weather_app")
+        A miss costs the lookup plus one conditional insert (and, on PostgreSQL,
+        one lock statement). Creation is serialized per coordinate bucket, so
+        concurrent requests for the same place create a single row.
+        """
 
         # First try to find by coordinates
         location = self.find_by_coordinates(latitude, longitude)
@@ -252,73 +467,73 @@ class LocationRepository(BaseRepository[Location]):
         # If not found, create a new location
         logger.debug(f"Creating new location: {name} at {latitude}, {longitude}")
 
+        now = datetime.now()
+        values: dict[str, Any] = {
+            "name": name,
+            "latitude": latitude,
+            "longitude": longitude,
+            "country": country,
+            "region": region,
+            "is_favorite": False,
+            "created_at": now,
+            "updated_at": now,
+            "geohash_bucket": coordinate_bucket(latitude, longitude),
+        }
+
         try:
-            # Create the new location within a session
             with self.db.get_session() as session:
-                new_location = Location(
-                    name=name,
-                    latitude=latitude,
-                    longitude=longitude,
-                    country=country,
-                    region=region,
-                    is_favorite=False,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
-                )
-
-                # Save to database
-                session.add(new_location)
-                session.commit()
-                session.refresh(new_location)
+                threshold = COORDINATE_BUCKET_SIZE
+                buckets = neighboring_buckets(latitude, longitude, threshold)
+                if session.get_bind().dialect.name == "postgresql":
+                    # Under READ COMMITTED two concurrent NOT EXISTS inserts can
+                    # both see no row and both insert, and there is no unique
+                    # key to stop them. Lock every bucket the guard reads, in
+                    # order so callers cannot deadlock; the locks are released
+                    # on commit, after which the waiting insert sees the row.
+                    session.execute(
+                        text(
+                            "SELECT pg_advisory_xact_lock(bucket) FROM "
+                            "(SELECT unnest(CAST(:buckets AS bigint[])) AS bucket "
+                            "ORDER BY bucket) AS locked"
+                        ),
+                        {"buckets": sorted(buckets)},
+                    )
 
-                logger.debug(
-                    f"Created new location: {new_location.name} (ID: {new_location.id})"
+                # Insert only if no location exists within the threshold. SQLite
+                # runs this single statement under its database write lock.
+                existing = select(Location.id).where(
+                    col(Location.geohash_bucket).in_(buckets),
+                    func.abs(Location.latitude - latitude) < threshold,
+                    func.abs(Location.longitude - longitude) < threshold,
                 )
-
-                # Return a detached copy to avoid session issues
-                return self._create_detached_location_copy(new_location)
-
+                location_columns = SQLModel.metadata.tables["location"].c
+                source = select(
+                    *(
+                        literal(value, location_columns[key].type)
+                        for key, value in values.items()
+                    )
+                ).where(~exists(existing))
+                statement = (
+                    insert(Location)
+                    .from_select(list(values), source)
+                    .returning(col(Location.id))
+                )
+                new_id = session.execute(statement).scalar_one_or_none()
+                session.commit()
         except Exception as e:
             error_msg = f"Failed to create location: {e}"
             logger.error(error_msg)
             raise DatabaseError(error_msg) from e
 
-    def _create_detached_location_copy(self, location: Location) -> Location:
-        """Create a detached copy of a location to avoid session issues"""
-
-        # Create a new instance with all the data from the original
-        try:
-            detached_copy = Location(
-                id=location.id,
-                name=location.name,
-                latitude=location.latitude,
-                longitude=location.longitude,
-                country=location.country,
-                region=location.region,
-                is_favorite=location.is_favorite,
-                created_at=getattr(location, "created_at", datetime.now()),
-                updated_at=datetime.now(),
-            )
-            return detached_copy
-        except Exception as e:
-            # If any attributes are missing, log and fall back to minimal copy
-
-            logger = logging.getLogger("weather_app")
-            logger.warning(
-                f"Error creating full detached copy: {e}, falling back to minimal copy"
-            )
+        if new_id is None:
+            # Another request created it between our lookup and insert
+            location = self.find_by_coordinates(latitude, longitude)
+            if location is None:
+                raise DatabaseError("Failed to create location: insert was skipped")
+            return location
 
-            return Location(
-                id=location.id if hasattr(location, "id") else None,
-                name=location.name if hasattr(location, "name") else "Unknown",
-                latitude=location.latitude if hasattr(location, "latitude") else 0.0,
-                longitude=location.longitude if hasattr(location, "longitude") else 0.0,
-                country=location.country if hasattr(location, "country") else "Unknown",
-                region=None,
-                is_favorite=False,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-            )
+        logger.debug(f"Created new location: {name} (ID: {new_id})")
+        return Location(id=new_id, **values)
 
 
 class WeatherRepository(BaseRepository[WeatherRecord]):
@@ -336,8 +551,7 @@ class WeatherRepository(BaseRepository[WeatherRecord]):
                     .order_by(WeatherRecord.timestamp.desc())
                     .limit(limit)
                 )
-                results = session.exec(statement).all()
-                return list(results)
+                return _fetch_all(session, statement)
         except SQLAlchemyError as e:
             error_msg = f"Failed to get weather records by location: {e}"
             raise DatabaseError(error_msg) from e
@@ -352,8 +566,7 @@ class WeatherRepository(BaseRepository[WeatherRecord]):
                     .where(WeatherRecord.timestamp >= cutoff_date)
                     .order_by(WeatherRecord.timestamp.desc())
                 )
-                results = session.exec(statement).all()
-                return list(results)
+                return _fetch_all(session, statement)
         except SQLAlchemyError as e:
             error_msg = f"Failed to get recent weather records: {e}"
             raise DatabaseError(error_msg) from e
@@ -373,6 +586,37 @@ class WeatherRepository(BaseRepository[WeatherRecord]):
             error_msg = f"Failed to get latest weather record: {e}"
             raise DatabaseError(error_msg) from e
 
+    def get_latest_for_locations(
+        self, location_ids: list[int]
+    ) -> dict[int, WeatherRecord]:
+        """Get the most recent weather record for each location in one query"""
+        if not location_ids:
+            return {}
+
+        try:
+            with self.db.get_session() as session:
+                row_number = (
+                    func.row_number()
+                    .over(
+                        partition_by=col(WeatherRecord.location_id),
+                        order_by=col(WeatherRecord.timestamp).desc(),
+                    )
+                    .label("rn")
+                )
+                ranked = (
+                    select(WeatherRecord, row_number)
+                    .where(col(WeatherRecord.location_id).in_(location_ids))
+                    .subquery()
+                )
+                latest = aliased(WeatherRecord, ranked)
+                statement = select(latest).where(ranked.c.rn == 1)
+                return {
+                    record.location_id: record for record in session.exec(statement)
+                }
+        except SQLAlchemyError as e:
+            error_msg = f"Failed to get latest weather records: {e}"
+            raise DatabaseError(error_msg) from e
+
 
 class SettingsRepository(BaseRepository[UserSettings]):
     """Repository for UserSettings entity operations"""
@@ -382,8 +626,6 @@ class SettingsRepository(BaseRepository[UserSettings]):
     def get_settings(self) -> UserSettings:
         """Get application settings, creating default settings if none exist"""
 
-        logger = logging.getLogger("weather_app")
-
         try:
             with self.db.get_session() as session:
                 # Get the first/only settings record (ID=1)
@@ -405,8 +647,7 @@ class SettingsRepository(BaseRepository[UserSettings]):
                     session.commit()
                     session.refresh(settings)
 
-                # Create a detached copy to avoid session issues
-                detached_settings = self._create_detached_settings_copy(settings)
+                detached_settings = _detach(session, settings)
                 logger.debug(
                     f"Retrieved settings: temp={detached_settings.temperature_unit}, "
                     f"forecast_days={detached_settings.forecast_days}"
@@ -428,8 +669,6 @@ class SettingsRepository(BaseRepository[UserSettings]):
     def update_temperature_unit(self, unit: str) -> UserSettings:
         """Update temperature unit preference"""
 
-        logger = logging.getLogger("weather_app")
-
         try:
             with self.db.get_session() as session:
                 # Get settings directly in this session
@@ -453,8 +692,7 @@ class SettingsRepository(BaseRepository[UserSettings]):
                 session.commit()
                 session.refresh(settings)
 
-                # Create a detached copy to return
-                detached_settings = self._create_detached_settings_copy(settings)
+                detached_settings = _detach(session, settings)
                 logger.debug(
                     f"Updated temperature unit to {detached_settings.temperature_unit}"
                 )
@@ -469,26 +707,6 @@ class SettingsRepository(BaseRepository[UserSettings]):
             default_settings.temperature_unit = unit.lower()
             return default_settings
 
-    def _create_detached_settings_copy(self, settings: UserSettings) -> UserSettings:
-        """Create a detached copy of settings to avoid session issues"""
-        try:
-            return UserSettings(
-                id=settings.id,
-                temperature_unit=settings.temperature_unit,
-                wind_speed_unit=settings.wind_speed_unit,
-                save_history=settings.save_history,
-                max_history_days=settings.max_history_days,
-                theme=settings.theme,
-                forecast_days=settings.forecast_days,
-                default_location_id=getattr(settings, "default_location_id", None),
-            )
-        except Exception as e:
-            # If error creating copy, return default settings
-
-            logger = logging.getLogger("weather_app")
-            logger.error(f"Error creating settings copy: {e}, falling back to defaults")
-            return self._create_default_settings()
-
     def _create_default_settings(self) -> UserSettings:
         """Create default settings object"""
         return UserSettings(
@@ -3,7 +3,7 @@ from typing import Literal, TypedDict
 # Temperature unit type used across modules (for now)
 CELSIUS = "C"
 FAHRENHEIT = "F"
-VALID_UNITS = {CELSIUS, FAHRENHEIT}
+VALID_UNITS = frozenset({CELSIUS, FAHRENHEIT})
 TemperatureUnit = Literal[CELSIUS, FAHRENHEIT]
 VALID_TEMP_UNITS = ["F", "C"]
 DEFAULT_TEMP_UNIT = "C"
@@ -1,17 +1,24 @@
 import os
-import re
+import time
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, cast
 
 from decouple import config
 from flask import Flask, flash, jsonify, redirect, render_template, request, url_for
 from flask_wtf.csrf import CSRFProtect
+from jinja2 import FileSystemBytecodeCache
 
-from weather_app.api import WeatherAPI
-from weather_app.current import CurrentWeatherManager
+try:
+    from flask_compress import Compress
+except ImportError:  # pragma: no cover - optional speedup
+    Compress = None
+
+from weather_app.api import WEATHER_CACHE_TTL, WeatherAPI
 from weather_app.database import init_db as initialize_database
 from weather_app.display import WeatherDisplay
-from weather_app.forecast import ForecastManager
 from weather_app.location import LocationManager
 from weather_app.repository import LocationRepository, SettingsRepository
 from weather_app.weather_types import TemperatureUnit
@@ -37,10 +44,17 @@ from .forms import (
 )
 from .helpers import (
     Helpers,
+    conditional_page,
     extract_location_from_query,
     get_forecast_data,
+    get_forecast_with_location,
     get_weather_data,
+    index_url,
+    not_modified,
+    page_etag,
+    upstream_executor,
 )
+from .json_provider import OrjsonProvider, orjson
 from .logging_config import init_debugging
 from .utils import (
     CELSIUS,
@@ -50,15 +64,12 @@ from .utils import (
     Utility,
 )
 
-# Configure port from environment variables with fallbacks
-PORT = config(
-    "FLASK_PORT",
-    default=config(
-        "PORT",
-        default=config("APP_PORT", default=os.environ.get("FLASK_PORT", 5001)),
-        cast=int,
-    ),
-    cast=int,
+# Configure port from environment variables with fallbacks; later names are
+# only looked up when the earlier ones are unset
+PORT = int(
+    config("FLASK_PORT", default="")
+    or config("PORT", default="")
+    or config("APP_PORT", default=5001)
 )
 
 # Initialize Flask app
@@ -66,9 +77,29 @@ app = Flask(__name__)
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "dev-secret-key")
 csrf = CSRFProtect(app)
 
+# Use the faster orjson encoder when it is installed
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Serialize JSON responses in insertion order instead of sorting every key
+app.json.sort_keys = False
+
+# Compress HTML and JSON responses when flask-compress is installed
+if Compress is not None:
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    app.config["COMPRESS_MIN_SIZE"] = 512
+    app.config["COMPRESS_LEVEL"] = 5
+    Compress(app)
+
 # Initialize debugging and logging
 init_debugging(app)
 
+# Persist compiled templates so restarted workers skip recompiling them
+TEMPLATE_CACHE_DIR = config("TEMPLATE_CACHE_DIR", default="")
+if TEMPLATE_CACHE_DIR:
+    os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+
 # Register error handlers
 register_error_handlers(app)
 
@@ -84,8 +115,6 @@ def initialize_app_components():
         "display": WeatherDisplay(),
         "location_manager": None,
         "location_repo": LocationRepository(),
-        "forecast_manager": None,
-        "current_manager": None,
         "settings_repo": SettingsRepository(),
         "utility": Utility(),
     }
@@ -104,67 +133,62 @@ utility = components.get("utility")
 # Initialize components that depend on others
 if weather_api and display:
     location_manager = LocationManager(weather_api, display)
-    forecast_manager = ForecastManager(weather_api, display)
-    current_manager = CurrentWeatherManager(weather_api, display)
 else:
     location_manager = None
-    forecast_manager = None
-    current_manager = None
 
 
-# Context processor to add current year to all templates
+@lru_cache(maxsize=1)
+def _current_year_context(hour: int) -> Mapping[str, int]:
+    # Read-only, since the same mapping is handed to every render
+    return MappingProxyType({"current_year": datetime.now().year})
+
+
+def favorites_version() -> Any:
+    """Version of the favorite locations, for the ETags of pages showing them."""
+    if not location_repo:
+        return None
+    return safe_database_operation(location_repo.get_favorites_version)
+
+
+# Context processor to add current year to all templates; the year is
+# re-read at most once an hour rather than on every render
 @app.context_processor
-def inject_current_year() -> dict[str, int]:
-    return {"current_year": datetime.now().year}
+def inject_current_year() -> Mapping[str, int]:
+    return _current_year_context(int(time.monotonic() // 3600))
 
 
 # Routes
 @app.route("/")
-def index() -> str:
+def index() -> Any:
     """Home page with search form."""
     app.logger.debug("Rendering index page")
+    # The page only changes with the favorites, so revalidate before rendering
+    version = favorites_version()
+    etag = page_etag("index", version, Helpers.get_normalized_unit())
+    unchanged = not_modified(etag)
+    if unchanged is not None:
+        return unchanged
+
+    # Only the forms the template renders; the forecast form is plain HTML
     search_form = LocationSearchForm()
-    ui_form = UserInputLocationForm()
-    unit_form = UnitSelectionForm()
-    forecast_days_form = ForecastDaysForm()
     nl_form = DateWeatherNLForm()
 
-    # Default to user's saved setting if available
-    try:
-        settings = (
-            safe_database_operation(settings_repo.get_settings)
-            if settings_repo
-            else None
-        )
-        if settings:
-            app.logger.debug(f"Using saved settings: {settings}")
-            unit_form.unit.default = (
-                "F" if settings.temperature_unit.lower() == "fahrenheit" else "C"
-            )
-            forecast_days_form.forecast_days.default = str(settings.forecast_days)
-            unit_form.process()
-            forecast_days_form.process()
-    except (AttributeError, ValueError) as e:
-        app.logger.warning(f"Settings data format issue: {e}")
-    except Exception as e:
-        app.logger.error(f"Error loading settings: {e}", exc_info=True)
-
     # Get favorite locations for quick access
     favorites = []
     if location_repo:
-        favorites = safe_database_operation(location_repo.get_favorites)
-        if favorites is None:
-            favorites = []
+        # safe_database_operation returns None (and flashes) on failure; the
+        # version read for the ETag spares the cache its own version query
+        favorites = safe_database_operation(location_repo.get_favorites, version) or []
         app.logger.debug(f"Loaded {len(favorites)} favorite locations")
 
-    return render_template(
-        "index.html",
-        search_form=search_form,
-        ui_form=ui_form,
-        unit_form=unit_form,
-        forecast_days_form=forecast_days_form,
-        nl_form=nl_form,
-        favorites=favorites,
+    return conditional_page(
+        render_template(
+            "index.html",
+            search_form=search_form,
+            nl_form=nl_form,
+            favorites=favorites,
+        ),
+        etag,
     )
 
 
@@ -191,7 +215,7 @@ def handle_location_search(query: str, unit: str, action: str = "weather") -> An
         if not results:
             app.logger.info(f"No locations found for query: {query}")
             flash(f"No locations found matching '{query}'", "warning")
-            return redirect(url_for("index"))
+            return redirect(index_url())
 
         if (
             len(results) == 1 and action != "nl"
@@ -215,15 +239,15 @@ def handle_location_search(query: str, unit: str, action: str = "weather") -> An
     except (ValueError, TypeError) as e:
         app.logger.error(f"Invalid location format: {e}", exc_info=True)
         flash(f"Invalid location format: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except (ConnectionError, TimeoutError) as e:
         app.logger.error(f"Weather service connection error: {e}", exc_info=True)
         flash(f"Weather service connection error: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except Exception as e:
         app.logger.error(f"Unexpected error in location search: {e}", exc_info=True)
         flash(f"Error searching for location: {e}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
 
 @app.route("/search", methods=["POST"])
@@ -231,21 +255,21 @@ def search() -> Any:
     """Search for locations."""
     app.logger.debug("Processing search request")
     form = LocationSearchForm()
-    unit = cast(TemperatureUnit, request.form.get("unit", DEFAULT_TEMP_UNIT).upper())
-    forecast_days = request.form.get("forecast_days")
+    form_data = request.form
+    unit = cast(
+        TemperatureUnit,
+        Helpers.get_normalized_unit(form_data.get("unit", DEFAULT_TEMP_UNIT)),
+    )
+    forecast_days = form_data.get("forecast_days")
 
     # Determine action based on which form was submitted
-    action = (
-        "forecast"
-        if "forecast_days" in request.form and request.form.get("forecast_days")
-        else "weather"
-    )
+    action = "forecast" if forecast_days else "weather"
     app.logger.debug(f"Search action: {action}")
 
     if not form.validate_on_submit():
         app.logger.warning("Search form validation failed")
         flash("Please enter a valid search query.", "warning")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
     query = form.query.data
     app.logger.debug(f"Search query: {query}")
@@ -253,7 +277,7 @@ def search() -> Any:
     if not validate_query_string(query):
         app.logger.warning(f"Invalid search query: {query}")
         flash("Invalid search query. Please check your input.", "warning")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
     result = handle_location_search(query, unit, action)
     if isinstance(result, tuple):
@@ -277,41 +301,37 @@ def select_location() -> Any:
     app.logger.debug("Processing location selection")
 
     # Get form data directly since we're using custom HTML radio buttons
-    selected_data = request.form.get("selected_location")
+    form_data = request.form
+    selected_data = form_data.get("selected_location")
     if not selected_data:
         app.logger.warning("No location selected in form submission")
         flash("Please select a location", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
     # Parse the selected location data
     try:
-        # Expected format: "lat,lon,name,region,country"
-        parts = selected_data.split(",", 4)
-        if len(parts) != 5:
-            raise ValueError("Invalid location data format")
-
-        lat, lon = safe_float_conversion(parts[0]), safe_float_conversion(parts[1])
-        name, region, country = parts[2:5]
+        # Expected format: "lat,lon,name,region,country". Only the coordinates
+        # are used, so the label is left whole even when a name has commas
+        lat_text, lon_text, label = selected_data.split(",", 2)
+        lat, lon = safe_float_conversion(lat_text), safe_float_conversion(lon_text)
 
         # Validate coordinates
         if not validate_coordinates(lat, lon):
             raise ValueError("Invalid coordinates")
 
-        app.logger.debug(
-            f"Selected location: {name}, {region}, {country} ({lat}, {lon})"
-        )
+        app.logger.debug(f"Selected location: {label} ({lat}, {lon})")
 
     except (ValueError, TypeError) as e:
         app.logger.error(
             f"Invalid location selection data: {selected_data}, error: {e}"
         )
         flash("Invalid location selection", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
-    action = request.form.get("action", "weather")
-    unit = request.form.get("unit", DEFAULT_TEMP_UNIT)
-    nl_query = request.form.get("nl_query")
-    forecast_days = request.form.get("forecast_days")
+    action = form_data.get("action", "weather")
+    unit = form_data.get("unit", DEFAULT_TEMP_UNIT)
+    nl_query = form_data.get("nl_query")
+    forecast_days = form_data.get("forecast_days")
 
     app.logger.debug(f"Action: {action}, Unit: {unit}, NL Query: {nl_query}")
 
@@ -349,7 +369,7 @@ def select_location() -> Any:
             f"Error redirecting after location selection: {e}", exc_info=True
         )
         flash("Error processing location selection", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
 
 @app.route("/weather/<path:coordinates>")
@@ -360,10 +380,10 @@ def weather_path(coordinates: str) -> Any:
         return weather(lat, lon)
     except ValueError as e:
         flash(f"Invalid coordinates format: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except (TypeError, AttributeError) as e:
         flash(f"Error parsing coordinates: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
 
 @app.route("/weather/<float:lat>/<float:lon>")
@@ -373,40 +393,55 @@ def weather(lat: float, lon: float) -> Any:
     if not validate_coordinates(lat, lon):
         logger.warning(f"Invalid coordinates provided: lat={lat}, lon={lon}")
         flash("Invalid coordinates provided.", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
     unit = Helpers.get_normalized_unit()
     coords = (lat, lon)
 
+    # Revalidate before fetching: the page only changes when the cached weather
+    # does (within one cache period, aligned across workers) or the location's
+    # favorite status does. Without a weather cache every request refetches.
+    if WEATHER_CACHE_TTL > 0:
+        weather_slot = int(time.time() // WEATHER_CACHE_TTL)
+        etag = page_etag("weather", lat, lon, unit, weather_slot, favorites_version())
+        unchanged = not_modified(etag)
+        if unchanged is not None:
+            return unchanged
+    else:
+        etag = page_etag("weather", lat, lon, unit, time.time())
+
     try:
         weather_data, location = get_weather_data(coords, unit, weather_api)
     except (ConnectionError, TimeoutError) as e:
         logger.error(f"Weather service connection error: {e}")
         flash(f"Weather service connection error: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except ValueError as e:
         logger.error(f"Invalid weather data: {e}")
         flash(f"Invalid weather data received: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except KeyError as e:
         logger.error(f"Weather data format error: {e}")
         flash(f"Weather data format error: missing {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except Exception as e:
         logger.error(f"Unexpected error getting weather data: {e}")
         flash("An unexpected error occurred getting weather data.", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
     # Safe database operation for saving weather record
     safe_database_operation(Helpers.save_weather_record, location, weather_data)
 
-    return render_template(
-        "weather.html",
-        weather=weather_data,
-        location=location,
-        unit=unit,
-        lat=lat,
-        lon=lon,
+    return conditional_page(
+        render_template(
+            "weather.html",
+            weather=weather_data,
+            location=location,
+            unit=unit,
+            lat=lat,
+            lon=lon,
+        ),
+        etag,
     )
 
 
@@ -414,19 +449,24 @@ def weather(lat: float, lon: float) -> Any:
 def ui_location() -> Any:
     """Handle UI location entry."""
     form = UserInputLocationForm()
-    unit = cast(TemperatureUnit, request.form.get("unit", DEFAULT_TEMP_UNIT).upper())
-    forecast_days = request.form.get("forecast_days")
+    form_data = request.form
+    unit = cast(
+        TemperatureUnit,
+        Helpers.get_normalized_unit(form_data.get("unit", DEFAULT_TEMP_UNIT)),
+    )
+    forecast_days = form_data.get("forecast_days")
 
     # Determine action - UI form is typically for weather
     action = "weather"
 
-    location = request.form.get("location") or (
+    # Blank input is rejected here, before any upstream search
+    location = form_data.get("location", "").strip() or (
         form.location.data if form.validate_on_submit() else None
     )
 
     if not location:
         flash("Please enter a valid location", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
     # Disambiguate location before searching
     location = Helpers.disambiguate_location(location)
@@ -435,14 +475,14 @@ def ui_location() -> Any:
         results = weather_api.search_city(location)
     except (ConnectionError, TimeoutError) as e:
         flash(f"Weather service connection error: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except ValueError as e:
         flash(f"Invalid location format: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
     if not results:
         flash(f"No cities found matching '{location}'", "warning")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
     if len(results) == 1:
         # Single result - redirect directly
@@ -482,7 +522,7 @@ def toggle_favorite(location_id: int) -> Any:
     except Exception as e:
         flash(f"Error updating favorite status: {e}", "error")
 
-    next_page = request.args.get("next") or url_for("index")
+    next_page = request.args.get("next") or index_url()
     return redirect(next_page)
 
 
@@ -504,7 +544,7 @@ def update_unit() -> Any:
             except Exception as e:
                 flash(f"Failed to update unit preference: {e}", "warning")
 
-    return redirect(url_for("index"))
+    return redirect(index_url())
 
 
 @app.route("/api/weather/<float:lat>/<float:lon>")
@@ -515,7 +555,14 @@ def api_weather(lat: float, lon: float) -> Any:
 
     try:
         weather_data, _ = get_weather_data(coords, unit, weather_api)
-        return jsonify(weather_data)
+        response = jsonify(weather_data)
+        # The payload carries both units, so clients may reuse it as long as
+        # the server-side weather cache would, and revalidate it by ETag after
+        response.cache_control.public = True
+        response.cache_control.max_age = int(WEATHER_CACHE_TTL)
+        response.cache_control.stale_while_revalidate = int(WEATHER_CACHE_TTL)
+        response.add_etag()
+        return response.make_conditional(request)
     except (ConnectionError, TimeoutError) as e:
         return jsonify({"error": f"Weather service connection error: {str(e)}"}), 503
     except ValueError as e:
@@ -529,6 +576,12 @@ def api_weather(lat: float, lon: float) -> Any:
 @app.route("/forecast/<float:lat>/<float:lon>", methods=["GET", "POST"])
 def forecast(lat: float, lon: float) -> Any:
     """Show forecast for a location."""
+    # Validate coordinate ranges before calling the weather service
+    if not validate_coordinates(lat, lon):
+        logger.warning(f"Invalid coordinates provided: lat={lat}, lon={lon}")
+        flash("Invalid coordinates provided.", "error")
+        return redirect(index_url())
+
     unit = Helpers.get_normalized_unit()
     coords = (lat, lon)
 
@@ -542,18 +595,20 @@ def forecast(lat: float, lon: float) -> Any:
         forecast_days = int(request.args.get("days", DEFAULT_FORECAST_DAYS))
 
     try:
-        formatted_forecast = get_forecast_data(coords, unit, weather_api)
-        # ADDED: Get location data just like the weather route does
-        _, location = get_weather_data(coords, unit, weather_api)
+        # The forecast carries its own location block, so the page's location
+        # comes from it rather than from another upstream lookup
+        formatted_forecast, location = get_forecast_with_location(
+            coords, unit, weather_api
+        )
     except (ConnectionError, TimeoutError) as e:
         flash(f"Weather service connection error: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except ValueError as e:
         flash(f"Invalid forecast data received: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except KeyError as e:
         flash(f"Forecast data format error: missing {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
     return render_template(
         "forecast.html",
@@ -570,9 +625,10 @@ def forecast(lat: float, lon: float) -> Any:
 def forecast_form() -> Any:
     """Process forecast form and redirect to forecast page."""
     form = ForecastDaysForm()
-    lat = request.form.get("lat")
-    lon = request.form.get("lon")
-    unit = request.form.get("unit", DEFAULT_TEMP_UNIT).upper()
+    form_data = request.form
+    lat = form_data.get("lat")
+    lon = form_data.get("lon")
+    unit = Helpers.get_normalized_unit(form_data.get("unit", DEFAULT_TEMP_UNIT))
 
     if lat and lon:
         if form.validate_on_submit():
@@ -588,7 +644,7 @@ def forecast_form() -> Any:
         flash("Invalid forecast days selection", "error")
         return redirect(url_for("weather_path", coordinates=f"{lat}/{lon}", unit=unit))
 
-    location = request.form.get("location")
+    location = form_data.get("location", "").strip()
     if location:
         # Disambiguate location before searching
         location = Helpers.disambiguate_location(location)
@@ -597,14 +653,14 @@ def forecast_form() -> Any:
             results = weather_api.search_city(location)
         except (ConnectionError, TimeoutError) as e:
             flash(f"Weather service connection error: {str(e)}", "error")
-            return redirect(url_for("index"))
+            return redirect(index_url())
         except ValueError as e:
             flash(f"Invalid location format: {str(e)}", "error")
-            return redirect(url_for("index"))
+            return redirect(index_url())
 
         if not results:
             flash(f"No cities found matching '{location}'", "warning")
-            return redirect(url_for("index"))
+            return redirect(index_url())
 
         if len(results) == 1 and form.validate_on_submit():
             forecast_days = form.forecast_days.data
@@ -633,7 +689,7 @@ def forecast_form() -> Any:
         )
 
     flash("Please provide location coordinates or location name", "error")
-    return redirect(url_for("index"))
+    return redirect(index_url())
 
 
 @app.route("/forecast/<path:coordinates>", methods=["GET", "POST"])
@@ -644,10 +700,10 @@ def forecast_path(coordinates: str) -> Any:
         return forecast(lat, lon)
     except ValueError:
         flash("Invalid coordinates format", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except Exception as e:
         flash(f"Error getting forecast: {e}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
 
 @app.route("/nl-date-weather", methods=["POST"])
@@ -658,7 +714,7 @@ def nl_date_weather() -> Any:
     unit = Helpers.get_normalized_unit()
     app.logger.debug(f"NL Query: {query}, Unit: {unit}")
 
-    # Extract location using multiple regex patterns with exception handling
+    # Extract location using the precompiled patterns in helpers
     try:
         location_name = extract_location_from_query(query)
         app.logger.debug(f"Extracted location: {location_name}")
@@ -670,11 +726,11 @@ def nl_date_weather() -> Any:
             "'Weather for Portland', or 'What's the weather like in Portland?')",
             "error",
         )
-        return redirect(url_for("index"))
-    except (re.error, AttributeError) as e:
+        return redirect(index_url())
+    except AttributeError as e:
         app.logger.error(f"Error parsing query format: {e}", exc_info=True)
         flash(f"Error parsing query format: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
     # Search for the location and get all possible matches
     result = handle_location_search(location_name, unit, "nl")
@@ -700,7 +756,7 @@ def nl_result_with_coords(coordinates: str) -> Any:
         # Parse coordinates from path
         lat, lon = Helpers.parse_coordinates_from_path(coordinates)
         query = request.args.get("query", "")
-        unit = request.args.get("unit", DEFAULT_TEMP_UNIT).upper()
+        unit = Helpers.get_normalized_unit()
         coords = (lat, lon)
 
         app.logger.debug(f"Processing NL result for coordinates: {coords}")
@@ -712,13 +768,17 @@ def nl_result_with_coords(coordinates: str) -> Any:
         if not success:
             app.logger.error(f"Location validation failed: {error_msg}")
             flash(f"Invalid location: {error_msg}", "error")
-            return redirect(url_for("index"))
+            return redirect(index_url())
 
-        # Get weather data
+        # Fetch the forecast alongside the current weather; they are
+        # independent upstream requests
+        forecast_future = upstream_executor.submit(
+            get_forecast_data, coords, unit, weather_api
+        )
         current_weather_data, location_obj = get_weather_data(coords, unit, weather_api)
         app.logger.debug(f"Got current weather for {location_obj.name}")
 
-        forecast_data = get_forecast_data(coords, unit, weather_api)
+        forecast_data = forecast_future.result()
         app.logger.debug(f"Got forecast data with {len(forecast_data)} days")
 
         # Save weather record (non-critical operation)
@@ -737,10 +797,9 @@ def nl_result_with_coords(coordinates: str) -> Any:
         )
         app.logger.debug(f"Filtered forecast to {len(filtered_forecast)} days")
 
-        # Convert dates to datetime objects for the template
-        dates = [
-            datetime.strptime(day["date"], "%Y-%m-%d") for day in filtered_forecast
-        ]
+        # Convert dates to datetime objects for the template; the API sends
+        # ISO dates, which fromisoformat parses without strptime's format engine
+        dates = [datetime.fromisoformat(day["date"]) for day in filtered_forecast]
 
         return render_template(
             "results_date_weather.html",
@@ -757,15 +816,15 @@ def nl_result_with_coords(coordinates: str) -> Any:
     except ValueError as e:
         app.logger.error(f"Value error in weather processing: {e}", exc_info=True)
         flash(str(e), "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except (ConnectionError, TimeoutError) as e:
         app.logger.error(f"Weather service connection error: {e}", exc_info=True)
         flash(f"Weather service connection error: {str(e)}", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
     except Exception as e:
         app.logger.error(f"Unexpected error in weather processing: {e}", exc_info=True)
         flash("An unexpected error occurred processing your request.", "error")
-        return redirect(url_for("index"))
+        return redirect(index_url())
 
 
 @app.route("/disambiguate-location", methods=["GET", "POST"])
@@ -774,9 +833,10 @@ def disambiguate_location() -> Any:
     form = LocationDisambiguationForm()
 
     if request.method == "GET":
-        query = request.args.get("query", "")
-        unit = request.args.get("unit", DEFAULT_TEMP_UNIT)
-        action = request.args.get("action", "weather")
+        args = request.args
+        query = args.get("query", "")
+        unit = args.get("unit", DEFAULT_TEMP_UNIT)
+        action = args.get("action", "weather")
 
         result = handle_location_search(query, unit, action)
         if isinstance(result, tuple):
@@ -822,14 +882,16 @@ def disambiguate_location() -> Any:
 
     # Form validation failed
     flash("Please select a location option.", "error")
-    return redirect(url_for("index"))
+    return redirect(index_url())
 
 
 # Run the app
 def run() -> None:
     """Run the Flask application."""
     app.logger.info(f"Starting Weather Dashboard on port {PORT}")
-    app.run(debug=True, host="0.0.0.0", port=PORT)
+    # Handlers mostly wait on the weather API and the database, so serve
+    # requests on threads rather than one at a time
+    app.run(debug=app.debug, host="0.0.0.0", port=PORT, threaded=True)
 
 
 if __name__ == "__main__":
@@ -25,6 +25,9 @@ def setup_logging():
 
 logger = setup_logging()
 
+# Substrings that mark a query as a likely script injection attempt
+DANGEROUS_QUERY_PATTERNS = ("<script", "javascript:", "data:", "vbscript:")
+
 
 # Input validation helpers
 def validate_coordinates(lat: Union[str, float], lon: Union[str, float]) -> bool:
@@ -134,9 +137,8 @@ def validate_query_string(query: str, max_length: int = 200) -> bool:
         return False
 
     # Check for potentially dangerous patterns
-    dangerous_patterns = ["<script", "javascript:", "data:", "vbscript:"]
     query_lower = query.lower()
-    for pattern in dangerous_patterns:
+    for pattern in DANGEROUS_QUERY_PATTERNS:
         if pattern in query_lower:
             logger.warning(f"Potentially dangerous query pattern detected: {pattern}")
             return False
@@ -321,8 +323,6 @@ def initialize_components_safely(component_init_func):
             "display": None,
             "location_manager": None,
             "location_repo": None,
-            "forecast_manager": None,
-            "current_manager": None,
             "settings_repo": None,
             "utility": None,
         }
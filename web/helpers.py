@@ -1,20 +1,63 @@
+import hashlib
+import queue
 import re
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any, Optional
 
-from flask import flash, redirect, render_template, request, url_for
+from flask import (
+    Response,
+    current_app,
+    flash,
+    make_response,
+    redirect,
+    render_template,
+    request,
+    session,
+    url_for,
+)
+from flask_wtf.csrf import generate_csrf
 
 from weather_app.api import WeatherAPI
-from weather_app.cli_app import WeatherApp
 from weather_app.current import CurrentWeatherManager
 from weather_app.display import WeatherDisplay
-from weather_app.forecast import ForecastManager
-from weather_app.location import LocationManager
 from weather_app.repository import LocationRepository, SettingsRepository
 from weather_app.weather_types import LocationData, TemperatureUnit, WeatherData
 
 from .error_handlers import logger
-from .utils import CELSIUS, DEFAULT_TEMP_UNIT, VALID_TEMP_UNITS
+from .utils import CELSIUS, DEFAULT_TEMP_UNIT, VALID_UNITS
+
+# Saves weather history off the request thread; each save opens its own session
+_background_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="weather-save"
+)
+
+# Records waiting to be saved; whichever save task runs next writes them all
+_pending_weather_records: "queue.SimpleQueue[tuple[Any, dict]]" = queue.SimpleQueue()
+
+# Runs an independent upstream fetch while the request thread makes another
+upstream_executor = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="weather-fetch"
+)
+
+# Current-conditions fields passed on to the weather page and JSON API
+CURRENT_WEATHER_FIELDS = (
+    "temp_c",
+    "temp_f",
+    "feelslike_c",
+    "feelslike_f",
+    "humidity",
+    "condition",
+    "wind_kph",
+    "wind_mph",
+    "wind_dir",
+    "pressure_mb",
+    "precip_mm",
+    "uv",
+    "last_updated",
+)
 
 # Location abbreviation mapping constant
 LOCATION_ABBREVIATION_MAPPING = {
@@ -47,16 +90,9 @@ WEEKDAY_TO_NUMBER = {
 }
 
 
-def extract_location_from_query(query: str) -> str:
-    """Extract location from natural language query."""
-    if not query or len(query.strip()) < 3:
-        raise ValueError("No location pattern matched")
-
-    # Remove extra whitespace
-    query = " ".join(query.split())
-
-    # Common non-location words that should not be considered locations
-    non_location_words = {
+# Common non-location words that should not be considered locations
+_NON_LOCATION_WORDS = frozenset(
+    {
         "like",
         "forecast",
         "weather",
@@ -99,9 +135,11 @@ def extract_location_from_query(query: str) -> str:
         "a",
         "an",
     }
+)
 
-    # Invalid phrase patterns that should never be considered locations
-    invalid_phrases = {
+# Invalid phrase patterns that should never be considered locations
+_INVALID_PHRASES = frozenset(
+    {
         "show me the",
         "weather like",
         "tell me",
@@ -109,6 +147,78 @@ def extract_location_from_query(query: str) -> str:
         "how is",
         "give me",
     }
+)
+
+# Weather-related words that rule a candidate out as a location
+_LOCATION_WEATHER_WORDS = frozenset(
+    {
+        "forecast",
+        "temperature",
+        "temp",
+        "rain",
+        "snow",
+        "wind",
+        "humid",
+        "hot",
+        "cold",
+        "warm",
+        "cool",
+    }
+)
+
+# Location patterns for natural language queries, compiled once and tried in
+# order by extract_location_from_query()
+_LOCATION_PATTERN_1 = re.compile(
+    r"(?:weather|forecast|temperature).*?(?:in|for|at)\s+"
+    r"([A-Za-z][A-Za-z\s,.-]+?)(?:\s+(?:tomorrow|today|yesterday|this|next|"
+    r"week|weekend|monday|tuesday|wednesday|thursday|friday|saturday|"
+    r"sunday)|[?!]|$)",
+    re.IGNORECASE,
+)
+
+_LOCATION_PATTERN_2 = re.compile(
+    r"^([A-Za-z][A-Za-z\s,.-]+?)\s+"
+    r"(?:weather|forecast|temperature|temp)(?:\s|$)",
+    re.IGNORECASE,
+)
+
+_LOCATION_PATTERN_3 = re.compile(
+    r"(?:weather|forecast|temperature)\s+([A-Za-z][A-Za-z\s,.-]+?)"
+    r"(?:\s+(?:tomorrow|today|yesterday|this|next|week|weekend|monday|"
+    r"tuesday|wednesday|thursday|friday|saturday|sunday)|[?!]|$)",
+    re.IGNORECASE,
+)
+
+_LOCATION_PATTERN_4 = re.compile(
+    r"^([A-Za-z]+(?:\s+[A-Za-z]+)*?)(?=\s+(?:tomorrow|today|yesterday|"
+    r"this|next|week|weekend|monday|tuesday|wednesday|thursday|friday|"
+    r"saturday|sunday|weather|forecast|temperature)|$)",
+    re.IGNORECASE,
+)
+
+_LOCATION_PATTERN_5 = re.compile(
+    r"(?:^|\s)(?:in|at|for)\s+([A-Za-z]+(?:\s+[A-Za-z]+)*?)"
+    r"(?=\s+(?:next|this|tomorrow|today|yesterday|week|weekend|monday|"
+    r"tuesday|wednesday|thursday|friday|saturday|sunday))",
+    re.IGNORECASE,
+)
+
+_LOCATION_PATTERN_6 = re.compile(
+    r"(?:how\s+(?:hot|cold|warm|cool|sunny|rainy|cloudy|windy)\s+is\s+it|"
+    r"is\s+it\s+(?:hot|cold|warm|cool|sunny|rainy|cloudy|windy))\s+"
+    r"(?:in|at)\s+([A-Za-z]+(?:\s+[A-Za-z]+)*?)"
+    r"(?:\s+(?:right\s+now|today|tomorrow|this|next|week)|[?!]|$)",
+    re.IGNORECASE,
+)
+
+
+def extract_location_from_query(query: str) -> str:
+    """Extract location from natural language query."""
+    if not query or len(query.strip()) < 3:
+        raise ValueError("No location pattern matched")
+
+    # Remove extra whitespace
+    query = " ".join(query.split())
 
     def is_valid_location(location: str) -> bool:
         """Check if a location string is valid."""
@@ -118,30 +228,17 @@ def extract_location_from_query(query: str) -> str:
         location_lower = location.lower().strip()
 
         # Check if it's a non-location word
-        if location_lower in non_location_words:
+        if location_lower in _NON_LOCATION_WORDS:
             return False
 
         # Check if it's an invalid phrase
-        if location_lower in invalid_phrases:
+        if location_lower in _INVALID_PHRASES:
             return False
 
         # Check if it contains weather-related words
-        weather_words = {
-            "forecast",
-            "temperature",
-            "temp",
-            "rain",
-            "snow",
-            "wind",
-            "humid",
-            "hot",
-            "cold",
-            "warm",
-            "cool",
-        }
         # Special handling for "weather" - allow if followed by comma
         # (like "Weather, Texas")
-        if any(word in location_lower for word in weather_words):
+        if any(word in location_lower for word in _LOCATION_WEATHER_WORDS):
             return False
         elif "weather" in location_lower and "," not in location_lower:
             # Reject "weather" unless it's part of a place name with comma
@@ -175,13 +272,7 @@ def extract_location_from_query(query: str) -> str:
         return True
 
     # Pattern 1: "weather in/for/at LOCATION" - stop at time words or punctuation
-    pattern1 = (
-        r"(?:weather|forecast|temperature).*?(?:in|for|at)\s+"
-        r"([A-Za-z][A-Za-z\s,.-]+?)(?:\s+(?:tomorrow|today|yesterday|this|next|"
-        r"week|weekend|monday|tuesday|wednesday|thursday|friday|saturday|"
-        r"sunday)|[?!]|$)"
-    )
-    match = re.search(pattern1, query, re.IGNORECASE)
+    match = _LOCATION_PATTERN_1.search(query)
     if match:
         location = match.group(1).strip().rstrip("?!.,").rstrip()
         # Clean up trailing punctuation but preserve internal punctuation
@@ -192,11 +283,7 @@ def extract_location_from_query(query: str) -> str:
             return location
 
     # Pattern 2: "LOCATION weather/forecast" - capture location before weather words
-    pattern2 = (
-        r"^([A-Za-z][A-Za-z\s,.-]+?)\s+"
-        r"(?:weather|forecast|temperature|temp)(?:\s|$)"
-    )
-    match = re.search(pattern2, query, re.IGNORECASE)
+    match = _LOCATION_PATTERN_2.search(query)
     if match:
         location = match.group(1).strip().rstrip("?!.,").rstrip()
         # Clean up trailing punctuation but preserve internal punctuation
@@ -206,12 +293,7 @@ def extract_location_from_query(query: str) -> str:
             return location
 
     # Pattern 3: "weather LOCATION" - capture location after weather, stop at time words
-    pattern3 = (
-        r"(?:weather|forecast|temperature)\s+([A-Za-z][A-Za-z\s,.-]+?)"
-        r"(?:\s+(?:tomorrow|today|yesterday|this|next|week|weekend|monday|"
-        r"tuesday|wednesday|thursday|friday|saturday|sunday)|[?!]|$)"
-    )
-    match = re.search(pattern3, query, re.IGNORECASE)
+    match = _LOCATION_PATTERN_3.search(query)
     if match:
         location = match.group(1).strip().rstrip("?!.,").rstrip()
         # Clean up trailing punctuation but preserve internal punctuation
@@ -225,12 +307,7 @@ def extract_location_from_query(query: str) -> str:
             return location
 
     # Pattern 4: "LOCATION" at start - stop at time/weather words
-    pattern4 = (
-        r"^([A-Za-z]+(?:\s+[A-Za-z]+)*?)(?=\s+(?:tomorrow|today|yesterday|"
-        r"this|next|week|weekend|monday|tuesday|wednesday|thursday|friday|"
-        r"saturday|sunday|weather|forecast|temperature)|$)"
-    )
-    match = re.search(pattern4, query, re.IGNORECASE)
+    match = _LOCATION_PATTERN_4.search(query)
     if match:
         location = match.group(1).strip().rstrip("?!.,").rstrip()
         # Clean up trailing punctuation but preserve internal punctuation
@@ -242,25 +319,14 @@ def extract_location_from_query(query: str) -> str:
 
     # Special fallback for complex queries - try to extract just city names
     # from known patterns. This handles cases like "Will it rain in Boston next Monday?"
-    pattern5 = (
-        r"(?:^|\s)(?:in|at|for)\s+([A-Za-z]+(?:\s+[A-Za-z]+)*?)"
-        r"(?=\s+(?:next|this|tomorrow|today|yesterday|week|weekend|monday|"
-        r"tuesday|wednesday|thursday|friday|saturday|sunday))"
-    )
-    match = re.search(pattern5, query, re.IGNORECASE)
+    match = _LOCATION_PATTERN_5.search(query)
     if match:
         location = match.group(1).strip()
         if is_valid_location(location) and len(location.split()) <= 3:
             return location
 
     # Pattern 6: "How [weather_word] is it in [LOCATION]" format
-    pattern6 = (
-        r"(?:how\s+(?:hot|cold|warm|cool|sunny|rainy|cloudy|windy)\s+is\s+it|"
-        r"is\s+it\s+(?:hot|cold|warm|cool|sunny|rainy|cloudy|windy))\s+"
-        r"(?:in|at)\s+([A-Za-z]+(?:\s+[A-Za-z]+)*?)"
-        r"(?:\s+(?:right\s+now|today|tomorrow|this|next|week)|[?!]|$)"
-    )
-    match = re.search(pattern6, query, re.IGNORECASE)
+    match = _LOCATION_PATTERN_6.search(query)
     if match:
         location = match.group(1).strip()
         if is_valid_location(location) and len(location.split()) <= 3:
@@ -280,6 +346,68 @@ def extract_location_with_geocoding(query_text: str) -> tuple[float, float]:
         ) from e
 
 
+@lru_cache(maxsize=8)
+def _index_url(script_root: str) -> str:
+    return url_for("index")
+
+
+def index_url() -> str:
+    """URL of the home page, built once per application root."""
+    return _index_url(request.script_root)
+
+
+def page_etag(*inputs: Any) -> str:
+    """Build a page's ETag from what it is rendered from, before rendering it.
+
+    Besides the route's own inputs, pages embed the session's CSRF token and
+    any flashed messages. The token's signature changes every second, so the
+    tag covers the session's CSRF secret and the token's validity window
+    instead; a revalidated page therefore still carries a usable token.
+    """
+    # Creates the session's CSRF secret on first use; the page reuses it
+    generate_csrf()
+    config = current_app.config
+    time_limit = config.get("WTF_CSRF_TIME_LIMIT", 3600)
+    csrf_window = int(time.time() // max(1, time_limit // 2)) if time_limit else 0
+    key = repr(
+        (
+            inputs,
+            session.get(config.get("WTF_CSRF_FIELD_NAME", "csrf_token")),
+            csrf_window,
+            session.get("_flashes"),
+        )
+    )
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _private_page(response: Response, etag: str) -> Response:
+    # Weak, as the bytes differ (the CSRF signature) while the page does not;
+    # response compression also leaves weak tags unchanged
+    response.set_etag(etag, weak=True)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def not_modified(etag: str) -> Optional[Response]:
+    """Answer 304 Not Modified if the client already has this page.
+
+    Routes call this before fetching or rendering anything. Pages with flashed
+    messages waiting are always rendered, so the messages are shown.
+    """
+    if session.get("_flashes") or not request.if_none_match.contains_weak(etag):
+        return None
+    return _private_page(make_response("", 304), etag)
+
+
+def conditional_page(body: str, etag: str) -> Response:
+    """Wrap a rendered page so browsers can revalidate it with its ETag.
+
+    Pages are only cached privately and always revalidated; see not_modified.
+    """
+    return _private_page(make_response(body), etag)
+
+
 def get_weather_data(
     coords: tuple[float, float], unit: TemperatureUnit, weather_api: WeatherAPI
 ) -> tuple[WeatherData, LocationData]:
@@ -288,27 +416,14 @@ def get_weather_data(
     if not weather_data:
         raise ValueError("Failed to get weather data")
 
-    location_obj, _ = Helpers.get_location_by_coordinates(coords[0], coords[1])
-    location_obj = Helpers.update_location_from_api_data(location_obj, weather_data)
-
-    # Format the weather data
-    formatted_data = {
-        "current": {
-            "temp_c": weather_data["current"]["temp_c"],
-            "temp_f": weather_data["current"]["temp_f"],
-            "feelslike_c": weather_data["current"]["feelslike_c"],
-            "feelslike_f": weather_data["current"]["feelslike_f"],
-            "humidity": weather_data["current"]["humidity"],
-            "condition": weather_data["current"]["condition"],
-            "wind_kph": weather_data["current"]["wind_kph"],
-            "wind_mph": weather_data["current"]["wind_mph"],
-            "wind_dir": weather_data["current"]["wind_dir"],
-            "pressure_mb": weather_data["current"]["pressure_mb"],
-            "precip_mm": weather_data["current"]["precip_mm"],
-            "uv": weather_data["current"]["uv"],
-            "last_updated": weather_data["current"]["last_updated"],
-        }
-    }
+    # The response names its own location, so no reverse geocode is needed
+    location_obj = Helpers.get_location_from_api_data(
+        coords[0], coords[1], weather_data
+    )
+
+    # Format the weather data, keeping only the fields the pages use
+    current = weather_data["current"]
+    formatted_data = {"current": {key: current[key] for key in CURRENT_WEATHER_FIELDS}}
 
     return formatted_data, location_obj
 
@@ -320,35 +435,67 @@ def get_forecast_data(
     forecast_data = weather_api.get_forecast(coords)
     if not forecast_data:
         raise ValueError("Failed to get forecast data")
+    return _format_forecast(forecast_data, unit)
+
+
+def get_forecast_with_location(
+    coords: tuple[float, float], unit: TemperatureUnit, weather_api: WeatherAPI
+) -> tuple[list[dict[str, Any]], LocationData]:
+    """Get forecast data and the stored location it describes."""
+    forecast_data = weather_api.get_forecast(coords)
+    if not forecast_data:
+        raise ValueError("Failed to get forecast data")
+
+    # The forecast names its own location, so no second lookup is needed
+    location_obj = Helpers.get_location_from_api_data(
+        coords[0], coords[1], forecast_data
+    )
+    return _format_forecast(forecast_data, unit), location_obj
+
+
+def _format_forecast(forecast_data: Any, unit: TemperatureUnit) -> list[dict[str, Any]]:
+    """Format the days of a forecast response for display."""
+    # Resolve the unit-specific keys once rather than for every day
+    if unit == CELSIUS:
+        max_key, min_key, wind_key, wind_unit = (
+            "maxtemp_c",
+            "mintemp_c",
+            "maxwind_kph",
+            "km/h",
+        )
+    else:
+        max_key, min_key, wind_key, wind_unit = (
+            "maxtemp_f",
+            "mintemp_f",
+            "maxwind_mph",
+            "mph",
+        )
 
     # Format the forecast data
     formatted_forecast = []
     for day in forecast_data["forecast"]["forecastday"]:
-        formatted_day = {
-            "date": day["date"],
-            "max_temp": (
-                day["day"]["maxtemp_c"] if unit == CELSIUS else day["day"]["maxtemp_f"]
-            ),
-            "min_temp": (
-                day["day"]["mintemp_c"] if unit == CELSIUS else day["day"]["mintemp_f"]
-            ),
-            "condition": day["day"]["condition"]["text"],
-            "icon": day["day"]["condition"]["icon"],
-            "chance_of_rain": day["day"]["daily_chance_of_rain"],
-            "chance_of_snow": day["day"]["daily_chance_of_snow"],
-            "maxwind_kph": day["day"]["maxwind_kph"],
-            "maxwind_mph": day["day"]["maxwind_mph"],
-            "wind_speed": day["day"]["maxwind_kph"]
-            if unit == CELSIUS
-            else day["day"]["maxwind_mph"],
-            "wind_unit": "km/h" if unit == CELSIUS else "mph",
-            "humidity": day["day"]["avghumidity"],
-            "totalprecip_mm": day["day"]["totalprecip_mm"],
-            "totalprecip_in": day["day"]["totalprecip_in"],
-            "avghumidity": day["day"]["avghumidity"],
-            "uv": day["day"]["uv"],
-        }
-        formatted_forecast.append(formatted_day)
+        day_data = day["day"]
+        condition = day_data["condition"]
+        formatted_forecast.append(
+            {
+                "date": day["date"],
+                "max_temp": day_data[max_key],
+                "min_temp": day_data[min_key],
+                "condition": condition["text"],
+                "icon": condition["icon"],
+                "chance_of_rain": day_data["daily_chance_of_rain"],
+                "chance_of_snow": day_data["daily_chance_of_snow"],
+                "maxwind_kph": day_data["maxwind_kph"],
+                "maxwind_mph": day_data["maxwind_mph"],
+                "wind_speed": day_data[wind_key],
+                "wind_unit": wind_unit,
+                "humidity": day_data["avghumidity"],
+                "totalprecip_mm": day_data["totalprecip_mm"],
+                "totalprecip_in": day_data["totalprecip_in"],
+                "avghumidity": day_data["avghumidity"],
+                "uv": day_data["uv"],
+            }
+        )
 
     return formatted_forecast
 
@@ -360,11 +507,8 @@ class Helpers:
     location_repo = LocationRepository()
     settings_repo = SettingsRepository()
 
-    # Initialize components that require dependencies
+    # Only the record builder is needed here; routes own the other managers
     current_manager = CurrentWeatherManager(weather_api, weather_display)
-    forecast_manager = ForecastManager(weather_api, weather_display)
-    location_manager = LocationManager(weather_api, weather_display)
-    app = WeatherApp()
 
     @classmethod
     def search_location_and_handle_results(cls, query: str, unit: str) -> Any:
@@ -379,7 +523,7 @@ class Helpers:
 
             if not results or len(results) == 0:
                 flash(f"No cities found matching '{query}'", "warning")
-                return redirect(url_for("index"))
+                return redirect(index_url())
 
             # If only one result, go directly to weather
             if len(results) == 1:
@@ -400,61 +544,35 @@ class Helpers:
             )
         except Exception as e:
             flash(f"Error finding location: {e}", "error")
-            return redirect(url_for("index"))
+            return redirect(index_url())
 
     @staticmethod
     def get_normalized_unit(unit_param: Optional[str] = None) -> str:
         # Get unit from request or parameter
         unit = (unit_param or request.args.get("unit", DEFAULT_TEMP_UNIT)).upper()
-        if unit not in VALID_TEMP_UNITS:
+        if unit not in VALID_UNITS:
             unit = DEFAULT_TEMP_UNIT
         return unit
 
     @classmethod
-    def get_location_by_coordinates(cls, lat: float, lon: float) -> tuple[Any, str]:
-        # Validate coordinates first
+    def get_location_from_api_data(cls, lat: float, lon: float, api_data: dict) -> Any:
+        """Get the stored location for coordinates, named from an API response.
+
+        A new location is created from the response's own location block, so
+        no reverse geocoding request is needed.
+        """
         if not cls._validate_coordinates(lat, lon):
             raise ValueError(f"Invalid coordinates: {lat}, {lon}")
 
-        # Try to find existing location first (within small radius)
-        try:
-            existing_location = cls.location_repo.find_by_coordinates_nearby(
-                lat, lon, radius_km=1
-            )
-            if existing_location:
-                coords = f"{lat},{lon}"
-                return existing_location, coords
-        except AttributeError:
-            # Method doesn't exist, continue with regular approach
-            pass
-        except Exception as e:
-            logger.warning(f"Error finding nearby location: {e}")
-
-        # Get location data from geocoding API
-        try:
-            location_data = cls._reverse_geocode(lat, lon)
-
-            location = cls.location_repo.find_or_create_by_coordinates(
-                name=location_data.get("name", f"Location {lat:.2f},{lon:.2f}"),
-                latitude=lat,
-                longitude=lon,
-                country=location_data.get("country", "Unknown"),
-                region=location_data.get("region"),
-            )
-
-        except Exception as e:
-            logger.warning(f"Error getting location data: {e}")
-            # Fallback to basic location if API fails
-            location = cls.location_repo.find_or_create_by_coordinates(
-                name=f"Location {lat:.2f},{lon:.2f}",
-                latitude=lat,
-                longitude=lon,
-                country="Unknown",
-                region=None,
-            )
-
-        coords = f"{lat},{lon}"
-        return location, coords
+        api_location = api_data.get("location") or {}
+        location = cls.location_repo.find_or_create_by_coordinates(
+            name=api_location.get("name", f"Location {lat:.2f},{lon:.2f}"),
+            latitude=lat,
+            longitude=lon,
+            country=api_location.get("country", "Unknown"),
+            region=api_location.get("region"),
+        )
+        return cls.update_location_from_api_data(location, api_data)
 
     @classmethod
     def _validate_coordinates(cls, lat: float, lon: float) -> bool:
@@ -490,53 +608,6 @@ class Helpers:
             "region": None,
         }
 
-    @classmethod
-    def _reverse_geocode_alternative(cls, lat: float, lon: float) -> dict:
-        """Alternative using a dedicated geocoding service"""
-        import requests
-
-        try:
-            # Using OpenStreetMap Nominatim (free, no API key needed)
-            url = "https://nominatim.openstreetmap.org/reverse"
-            params = {"lat": lat, "lon": lon, "format": "json", "accept-language": "en"}
-            headers = {"User-Agent": "WeatherApp/1.0"}
-
-            response = requests.get(url, params=params, headers=headers, timeout=5)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Extract relevant information
-            display_name = data.get("display_name", "")
-            address = data.get("address", {})
-
-            # Try to get city/town name
-            name = (
-                address.get("city")
-                or address.get("town")
-                or address.get("village")
-                or address.get("hamlet")
-                or address.get("suburb")
-                or display_name.split(",")[0]
-                if display_name
-                else f"Location {lat:.2f},{lon:.2f}"
-            )
-
-            country = address.get("country", "Unknown")
-            region = (
-                address.get("state") or address.get("province") or address.get("region")
-            )
-
-            return {"name": name, "country": country, "region": region}
-
-        except Exception as e:
-            logger.error(f"Reverse geocoding failed: {e}")
-            return {
-                "name": f"Location {lat:.2f},{lon:.2f}",
-                "country": "Unknown",
-                "region": None,
-            }
-
     @staticmethod
     def disambiguate_location(location_name: str) -> str:
         """Disambiguate common ambiguous location names."""
@@ -679,11 +750,34 @@ class Helpers:
 
     @classmethod
     def save_weather_record(cls, location: Any, weather_data: dict) -> None:
+        """Queue the weather record to be saved after the response is sent."""
+        _pending_weather_records.put((location, weather_data))
+        _background_executor.submit(cls._save_weather_records)
+
+    @classmethod
+    def _save_weather_records(cls) -> None:
+        # Drain everything queued so far, so records that arrive together are
+        # written in one statement; a task that finds the queue empty is a no-op
+        records = []
+        while True:
+            try:
+                location, weather_data = _pending_weather_records.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                records.append(
+                    cls.current_manager._build_weather_record(location, weather_data)
+                )
+            except Exception as e:
+                logger.warning(f"Skipping unsaveable weather data: {e}")
+        if not records:
+            return
+
+        # Runs outside the request, so failures are logged rather than flashed
         try:
-            cls.current_manager._save_weather_record(location, weather_data)
+            cls.current_manager.weather_repo.bulk_create(records)
         except Exception as e:
-            logger.warning(f"Failed to save weather data: {e}")
-            flash(f"Note: Failed to save weather data: {e}", "warning")
+            logger.warning(f"Failed to save {len(records)} weather records: {e}")
 
     @staticmethod
     def parse_coordinates_from_path(coordinates: str) -> tuple[float, float]:
@@ -773,6 +867,14 @@ class Helpers:
         end_date = datetime.combine(today, datetime.min.time())
         return start_date, end_date
 
+    @staticmethod
+    def _days_in_range(
+        days: list[dict[str, Any]], start_date: datetime, end_date: datetime
+    ) -> list[dict[str, Any]]:
+        # Bounds are converted once; each day's ISO date is parsed exactly once
+        first, last = start_date.date(), end_date.date()
+        return [day for day in days if first <= date.fromisoformat(day["date"]) <= last]
+
     @classmethod
     def filter_forecast_by_dates(
         cls, forecast_data, start_date: datetime, end_date: datetime
@@ -780,12 +882,8 @@ class Helpers:
         # Handle both raw API response format and formatted list format
         if isinstance(forecast_data, list):
             # This is formatted forecast data (list of dicts)
-            filtered_days = []
             try:
-                for day in forecast_data:
-                    day_date = datetime.strptime(day["date"], "%Y-%m-%d").date()
-                    if start_date.date() <= day_date <= end_date.date():
-                        filtered_days.append(day)
+                filtered_days = cls._days_in_range(forecast_data, start_date, end_date)
             except (ValueError, KeyError) as e:
                 logger.error(f"Error filtering formatted forecast data: {e}")
                 return forecast_data  # Return original data on error
@@ -798,12 +896,10 @@ class Helpers:
         if "forecastday" not in forecast_data["forecast"]:
             return forecast_data
 
-        filtered_days = []
         try:
-            for day in forecast_data["forecast"]["forecastday"]:
-                day_date = datetime.strptime(day["date"], "%Y-%m-%d").date()
-                if start_date.date() <= day_date <= end_date.date():
-                    filtered_days.append(day)
+            filtered_days = cls._days_in_range(
+                forecast_data["forecast"]["forecastday"], start_date, end_date
+            )
         except (ValueError, KeyError) as e:
             logger.error(f"Error filtering forecast data: {e}")
             return forecast_data  # Return original data on error
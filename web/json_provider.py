@@ -0,0 +1,37 @@
+"""JSON provider backed by orjson when it is installed"""
+
+from typing import Any, Union
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# Keyword arguments orjson can honour; anything else uses the stdlib encoder
+_ORJSON_DUMP_ARGS = frozenset({"indent", "separators", "sort_keys"})
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize with orjson, keeping Flask's handling of dates and other types"""
+
+    # orjson always writes UTF-8 rather than escaping non-ASCII characters
+    ensure_ascii = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if not kwargs.keys() <= _ORJSON_DUMP_ARGS:
+            return super().dumps(obj, **kwargs)
+
+        # Datetimes go through Flask's default so they keep the HTTP date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
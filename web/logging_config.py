@@ -64,6 +64,10 @@ def init_debugging(app):
     if app.debug:
         app.config["TEMPLATES_AUTO_RELOAD"] = True
         app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 0
+    else:
+        # Compiled templates are reused without checking the files for changes
+        app.config["TEMPLATES_AUTO_RELOAD"] = False
+        app.jinja_env.auto_reload = False
 
     # Setup logging
     setup_logging(app)
@@ -2,7 +2,7 @@ from typing import Any, Literal
 
 CELSIUS = "C"
 FAHRENHEIT = "F"
-VALID_UNITS = {CELSIUS, FAHRENHEIT}
+VALID_UNITS = frozenset({CELSIUS, FAHRENHEIT})
 TemperatureUnit = Literal[CELSIUS, FAHRENHEIT]
 VALID_TEMP_UNITS = ["F", "C"]
 DEFAULT_TEMP_UNIT = "C"